@@ -29,7 +29,12 @@ async def create_test_session():
     1. Creates stdio client connection to your MCP server
     2. Returns (session, cleanup) tuple
     3. ALWAYS call cleanup() in finally block
-    
+
+    Set MCP_TEST_INPROC=1 to connect to the server in-process over memory
+    streams instead of spawning a subprocess per test. This is much faster
+    for quick local runs; the default stdio path remains the one that
+    exercises the real protocol transport.
+
     Returns:
         Tuple of (session, cleanup_function)
     """
@@ -38,7 +43,24 @@ async def create_test_session():
     from pathlib import Path
     from mcp import ClientSession, StdioServerParameters
     from mcp.client.stdio import stdio_client, get_default_environment
-    
+
+    if os.environ.get("MCP_TEST_INPROC") == "1":
+        from mcp.shared.memory import create_connected_server_and_client_session
+        from example_server.server.app import server
+
+        # Same manual context management as the stdio path below. Pass the
+        # low-level server: only newer mcp releases unwrap a FastMCP here.
+        inproc_context = create_connected_server_and_client_session(server._mcp_server)
+        session = await inproc_context.__aenter__()
+
+        async def cleanup():
+            try:
+                await inproc_context.__aexit__(None, None, None)
+            except Exception:
+                pass
+
+        return session, cleanup
+
     # Get project root and server module
     project_root = Path(__file__).parent.parent.parent
     server_module = f"example_server.server.app"
@@ -109,12 +131,7 @@ async def test_successful_tool_execution_pattern():
         assert result.isError is False, f"Tool failed: {result}"
         
         # Step 4: Extract and verify content
-        text_content = None
-        for content in result.content:
-            if isinstance(content, types.TextContent):
-                text_content = content.text
-                break
-        
+        text_content = _extract_text_content(result)
         assert text_content is not None, "No text content in response"
         
         # Step 5: Parse and verify response (tools often return JSON)
@@ -159,11 +176,7 @@ async def test_error_handling_pattern():
         assert result.isError is True, "Should return error for invalid input"
         
         # Extract error message
-        error_msg = ""
-        for content in result.content:
-            if isinstance(content, types.TextContent):
-                error_msg = content.text
-                break
+        error_msg = _extract_error_text(result) or ""
         
         # Verify error message contains expected text
         assert "min_value must be less than or equal to max_value" in error_msg
@@ -354,10 +367,10 @@ def _extract_text_content(result: types.CallToolResult) -> Optional[str]:
     
     Use this pattern in your tests to get the actual response text.
     """
-    for content in result.content:
-        if isinstance(content, types.TextContent):
-            return content.text
-    return None
+    return next(
+        (content.text for content in result.content if isinstance(content, types.TextContent)),
+        None
+    )
 
 
 def _extract_error_text(result: types.CallToolResult) -> Optional[str]:
@@ -398,14 +411,10 @@ class TestYourToolIntegration:
     - Logical grouping of related tests
     - Shared fixtures within class
     - Clear test organization
-    """
     
-    def _extract_text_content(self, result):
-        """Shared helper method."""
-        for content in result.content:
-            if isinstance(content, types.TextContent):
-                return content.text
-        return None
+    Use the module-level helpers (_extract_text_content etc.) rather than
+    copying them into each class as methods.
+    """
     
     @pytest.mark.anyio
     async def test_your_tool_success(self):
@@ -1,9 +1,26 @@
 """MCP server with SAAGA decorators"""
 
-from example_server.server import server
+from typing import Any
 
 __version__ = "0.1.0"
 __author__ = "Your Name"
 __email__ = "email@example.com"
 
-__all__ = ["server"]
\ No newline at end of file
+__all__ = ["server"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import and build the server on first access.
+    
+    Importing a submodule (e.g. the decorators) no longer pulls in the MCP
+    server and runs its startup. The lazy hook itself lives in
+    ``server.app``; this one and the ``server`` package's forward to it.
+    """
+    if name == "server":
+        from example_server.server.app import create_mcp_server
+        server = create_mcp_server()
+        # Importing the ``server`` subpackage bound the module to this name;
+        # point it back at the instance, as the eager import used to
+        globals()["server"] = server
+        return server
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
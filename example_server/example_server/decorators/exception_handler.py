@@ -29,6 +29,18 @@ from example_server.log_system.unified_logger import UnifiedLogger
 from example_server.log_system.correlation import get_correlation_id
 
 
+class _LazyTraceback:
+    """Formats an exception's traceback only when the log message is rendered."""
+    
+    __slots__ = ("exc",)
+    
+    def __init__(self, exc: BaseException):
+        self.exc = exc
+    
+    def __str__(self) -> str:
+        return "".join(traceback.format_exception(self.exc))
+
+
 def exception_handler(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
     """Decorator to handle exceptions in MCP tools gracefully - SAAGA Pattern.
     
@@ -42,23 +54,31 @@ def exception_handler(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awai
         The decorated async function with exception handling
     """
     
+    # Resolve names once at decoration time. The logger itself is still fetched
+    # per exception because get_logger binds the current correlation ID.
+    tool_name = func.__name__
+    logger_name = f"tool.{tool_name}"
+    
     @wraps(func)
     async def wrapper(*args, **kwargs) -> Any:
         try:
             return await func(*args, **kwargs)
         except Exception as e:
             # Get correlation-aware logger with tool name
-            logger = UnifiedLogger.get_logger(f"tool.{func.__name__}")
+            logger = UnifiedLogger.get_logger(logger_name)
             
-            # Log the full traceback for debugging
-            tb_str = traceback.format_exc()
+            # Log the full traceback for debugging. It is passed as a format
+            # argument so it is only rendered if a sink accepts ERROR, and
+            # braces in the traceback text cannot break message formatting.
             logger.error(
-                f"Exception in {func.__name__}: {tb_str}",
+                "Exception in {}: {}",
+                tool_name,
+                _LazyTraceback(e),
                 log_type="tool_execution",
-                tool_name=func.__name__,
+                tool_name=tool_name,
                 status="error",
                 error_message=str(e),
-                exception_type=type(e).__name__
+                exception_type=e.__class__.__name__
             )
             
             # Re-raise the exception for MCP to handle properly
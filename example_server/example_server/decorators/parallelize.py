@@ -11,7 +11,7 @@ for parallel execution following SAAGA standards:
 Features:
 - Automatic parallelization of compatible tools
 - Signature transformation for batch processing
-- Concurrent execution with asyncio.gather
+- Concurrent execution with asyncio.TaskGroup
 - Fail-fast error handling (SAAGA standard)
 - Type validation for input parameters
 
@@ -26,7 +26,6 @@ Usage:
 """
 
 import asyncio
-from functools import wraps
 from typing import Callable, Any, Awaitable, List, Dict, Union
 import logging
 import inspect
@@ -64,28 +63,26 @@ def _set_parallelized_signature_and_annotations(
         )
         params.append(ctx_param)
     
-    new_sig = inspect.Signature(
+    # FastMCP reads the signature when the tool is registered, so it is
+    # built here; the annotations are derived from the same parameters
+    wrapper_func.__signature__ = inspect.Signature(
         parameters=params,
         return_annotation=return_annotation
     )
-    
-    wrapper_func.__signature__ = new_sig
-    annotations = {
-        param_name: param_annotation,
-        'return': return_annotation
-    }
-    if preserve_context:
-        from mcp.server.fastmcp import Context
-        annotations['ctx'] = Context
+    annotations = {param.name: param.annotation for param in params}
+    annotations['return'] = return_annotation
     
     wrapper_func.__annotations__ = annotations
 
-def _build_parallelized_docstring(func: Callable) -> str:
-    """Constructs the docstring for the parallelized wrapper function."""
+def _build_parallelized_docstring(func: Callable, sig: inspect.Signature) -> str:
+    """Constructs the docstring for the parallelized wrapper function.
+    
+    Takes the signature parallelize already captured rather than
+    inspecting func a second time.
+    """
     original_doc = func.__doc__.strip() if func.__doc__ else "No original docstring provided."
     func_name = func.__name__
     
-    sig = inspect.signature(func)
     params = []
     for name, param in sig.parameters.items():
         if param.annotation != inspect.Parameter.empty:
@@ -146,7 +143,20 @@ def parallelize(func: Callable[..., Awaitable[Any]]) -> Callable[[List[Dict]], A
     # Store original function signature for introspection
     original_signature = inspect.signature(func)
     
-    @wraps(func)
+    # Precompute which keyword arguments each call needs and accepts, so
+    # items can be validated with set operations instead of Signature.bind
+    parameters = original_signature.parameters.values()
+    required_names = frozenset(
+        p.name for p in parameters
+        if p.default is inspect.Parameter.empty
+        and p.kind not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+    )
+    accepted_names = frozenset(
+        p.name for p in parameters
+        if p.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+    )
+    accepts_any_keyword = any(p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters)
+    
     async def wrapper(kwargs_list: List[Dict], ctx = None) -> List[Any]:
         """Execute function in parallel for each kwargs dict.
         
@@ -159,10 +169,10 @@ def parallelize(func: Callable[..., Awaitable[Any]]) -> Callable[[List[Dict]], A
             raise TypeError("Parallel tools require List[Dict] parameter")
         
         if not kwargs_list:
-            logger.warning(f"Empty kwargs_list provided to {func.__name__}")
+            logger.warning("Empty kwargs_list provided to %s", func.__name__)
             return []
         
-        logger.info(f"Parallel execution of {func.__name__} with {len(kwargs_list)} items")
+        logger.info("Parallel execution of %s with %d items", func.__name__, len(kwargs_list))
         
         # Validate all items are dictionaries
         for i, kwargs in enumerate(kwargs_list):
@@ -173,36 +183,47 @@ def parallelize(func: Callable[..., Awaitable[Any]]) -> Callable[[List[Dict]], A
         original_params = list(original_signature.parameters.keys())
         expects_context = 'ctx' in original_params
         
-        # Execute all calls concurrently
-        tasks = []
-        for i, kwargs in enumerate(kwargs_list):
-            try:
-                # Make a copy to avoid modifying the original
-                call_kwargs = kwargs.copy()
-                
-                # If the original function expects Context and we have one, add it
-                if expects_context and ctx is not None:
-                    call_kwargs['ctx'] = ctx
-                
-                # Validate parameters against original function signature
-                bound_args = original_signature.bind(**call_kwargs)
-                bound_args.apply_defaults()
-                
-                task = func(**call_kwargs)
-                tasks.append(task)
-            except Exception as e:
-                # If function call fails immediately, create a failed task
-                async def failed_task():
-                    raise e
-                tasks.append(failed_task())
+        # Prepare every call first so an invalid item fails the batch
+        # before any call has started
+        calls = []
+        for kwargs in kwargs_list:
+            # Make a copy to avoid modifying the original
+            call_kwargs = kwargs.copy()
+            
+            # If the original function expects Context and we have one, add it
+            if expects_context and ctx is not None:
+                call_kwargs['ctx'] = ctx
+            
+            # Validate parameters against original function signature.
+            # bind() only runs on failure, to raise its standard TypeError.
+            call_names = call_kwargs.keys()
+            if not required_names <= call_names or (
+                not accepts_any_keyword and not call_names <= accepted_names
+            ):
+                original_signature.bind(**call_kwargs)
+            
+            calls.append(call_kwargs)
         
-        # Wait for all tasks to complete - SAAGA fail-fast behavior
-        results = await asyncio.gather(*tasks)
+        # Execute all calls concurrently - SAAGA fail-fast behavior: the first
+        # failure cancels the remaining calls and is raised as-is
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                tasks = [task_group.create_task(func(**call_kwargs)) for call_kwargs in calls]
+        except BaseExceptionGroup as group:
+            raise group.exceptions[0] from None
         
-        return results
+        return [task.result() for task in tasks]
+    
+    # Copy the identity attributes by hand: functools.wraps would also copy
+    # __doc__, __annotations__ and __dict__ (including the inner function's
+    # __signature__), all of which are replaced below
+    wrapper.__module__ = func.__module__
+    wrapper.__name__ = func.__name__
+    wrapper.__qualname__ = func.__qualname__
+    wrapper.__wrapped__ = func
     
     # Update the docstring and signature for the wrapper function
-    wrapper.__doc__ = _build_parallelized_docstring(func)
+    wrapper.__doc__ = _build_parallelized_docstring(func, original_signature)
     _set_parallelized_signature_and_annotations(
         wrapper_func=wrapper,
         param_name="kwargs_list",
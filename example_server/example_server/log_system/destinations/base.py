@@ -53,6 +53,19 @@ class LogDestination(ABC):
         """
         pass
     
+    async def write_many(self, entries: List[LogEntry]) -> None:
+        """Write several log entries to the destination.
+        
+        The default implementation writes entries one at a time. Destinations
+        that can amortize per-write cost (e.g. one transaction per batch)
+        should override this.
+        
+        Args:
+            entries: The log entries to write, in order
+        """
+        for entry in entries:
+            await self.write(entry)
+    
     @abstractmethod
     async def query(self, **filters) -> List[LogEntry]:
         """Query logs with filters.
@@ -15,6 +15,26 @@ from typing import Dict, Any, List, Optional
 from ..destinations.base import LogDestination, LogEntry
 from example_server.config import ServerConfig
 
+# Use orjson for the JSON columns when it is installed; it is a drop-in
+# speedup for the per-entry serialization on the write path.
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # orjson rejects values json handles (ints over 64 bits) and
+            # anything it can't encode - fall back like the stdlib path
+            return json.dumps(obj, default=str)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, default=str)
+
+    _json_loads = json.loads
+
 
 class SQLiteDestination(LogDestination):
     """SQLite implementation of LogDestination.
@@ -53,6 +73,11 @@ class SQLiteDestination(LogDestination):
             # Enable foreign keys and WAL mode for better concurrency
             self._local.connection.execute("PRAGMA foreign_keys = ON")
             self._local.connection.execute("PRAGMA journal_mode = WAL")
+            # With WAL, NORMAL only syncs at checkpoints. The database stays
+            # consistent, but a power loss or OS crash can drop the most
+            # recently committed log entries (an application crash cannot).
+            self._local.connection.execute("PRAGMA synchronous = NORMAL")
+            self._local.connection.execute("PRAGMA temp_store = MEMORY")
         return self._local.connection
     
     def _initialize_database(self) -> None:
@@ -90,29 +115,26 @@ class SQLiteDestination(LogDestination):
         """)
         conn.commit()
     
-    def write_sync(self, entry: LogEntry) -> None:
-        """Write a log entry to SQLite synchronously.
-        
-        Args:
-            entry: The log entry to write
-        """
-        conn = self._get_connection()
-        
+    _INSERT_SQL = """
+        INSERT INTO unified_logs (
+            correlation_id, timestamp, level, log_type, message,
+            tool_name, duration_ms, status, input_args, output_summary,
+            error_message, module, function, line, thread_name,
+            process_id, extra_data
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    @staticmethod
+    def _entry_to_row(entry: LogEntry) -> tuple:
+        """Convert a log entry into an INSERT parameter tuple."""
         # Serialize complex fields to JSON
-        input_args_json = json.dumps(entry.input_args) if entry.input_args else None
-        extra_data_json = json.dumps(entry.extra_data) if entry.extra_data else None
+        input_args_json = _json_dumps(entry.input_args) if entry.input_args else None
+        extra_data_json = _json_dumps(entry.extra_data) if entry.extra_data else None
         
         # Convert timestamp to string format for SQLite
         timestamp_str = entry.timestamp.isoformat() if isinstance(entry.timestamp, datetime) else str(entry.timestamp)
         
-        conn.execute("""
-            INSERT INTO unified_logs (
-                correlation_id, timestamp, level, log_type, message,
-                tool_name, duration_ms, status, input_args, output_summary,
-                error_message, module, function, line, thread_name,
-                process_id, extra_data
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        return (
             entry.correlation_id,
             timestamp_str,
             entry.level,
@@ -130,9 +152,54 @@ class SQLiteDestination(LogDestination):
             entry.thread_name,
             entry.process_id,
             extra_data_json
-        ))
+        )
+    
+    def write_sync(self, entry: LogEntry) -> None:
+        """Write a log entry to SQLite synchronously.
+        
+        Args:
+            entry: The log entry to write
+        """
+        conn = self._get_connection()
+        conn.execute(self._INSERT_SQL, self._entry_to_row(entry))
         conn.commit()
     
+    def write_many_sync(self, entries: List[LogEntry]) -> None:
+        """Write several log entries to SQLite in a single transaction.
+        
+        An entry that can't be serialized or inserted is skipped, so the rest
+        of the batch is still written. ValueError is raised afterwards with
+        the number of entries skipped.
+        
+        Args:
+            entries: The log entries to write
+        """
+        if not entries:
+            return
+        rows = []
+        skipped = 0
+        for entry in entries:
+            try:
+                rows.append(self._entry_to_row(entry))
+            except (TypeError, ValueError):
+                skipped += 1
+        
+        conn = self._get_connection()
+        try:
+            with conn:
+                conn.executemany(self._INSERT_SQL, rows)
+        except (sqlite3.IntegrityError, sqlite3.InterfaceError, sqlite3.ProgrammingError):
+            # The batch was rolled back - retry row by row, dropping only the bad ones
+            with conn:
+                for row in rows:
+                    try:
+                        conn.execute(self._INSERT_SQL, row)
+                    except (sqlite3.IntegrityError, sqlite3.InterfaceError, sqlite3.ProgrammingError):
+                        skipped += 1
+        
+        if skipped:
+            raise ValueError(f"Skipped {skipped} of {len(entries)} log entries that could not be written")
+    
     async def write(self, entry: LogEntry) -> None:
         """Write a log entry to SQLite (async wrapper for compatibility).
         
@@ -142,6 +209,14 @@ class SQLiteDestination(LogDestination):
         # SQLite operations are synchronous anyway, so just call the sync version
         self.write_sync(entry)
     
+    async def write_many(self, entries: List[LogEntry]) -> None:
+        """Write several log entries with one commit (async wrapper).
+        
+        Args:
+            entries: The log entries to write
+        """
+        self.write_many_sync(entries)
+    
     async def query(self, **filters) -> List[LogEntry]:
         """Query logs with filters.
         
@@ -210,8 +285,8 @@ class SQLiteDestination(LogDestination):
         
         for row in cursor:
             # Parse JSON fields
-            input_args = json.loads(row['input_args']) if row['input_args'] else None
-            extra_data = json.loads(row['extra_data']) if row['extra_data'] else {}
+            input_args = _json_loads(row['input_args']) if row['input_args'] else None
+            extra_data = _json_loads(row['extra_data']) if row['extra_data'] else {}
             
             # Parse timestamp
             timestamp = datetime.fromisoformat(row['timestamp']) if row['timestamp'] else datetime.now()
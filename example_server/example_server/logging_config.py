@@ -1,9 +1,11 @@
 """Logging configuration for Example Server MCP server"""
 
+import atexit
 import logging
 import logging.handlers
 import os
 import platform
+import queue
 import sys
 from pathlib import Path
 from typing import Optional
@@ -12,6 +14,9 @@ from loguru import logger as loguru_logger
 from example_server.config import ServerConfig
 from example_server.decorators.sqlite_logger import initialize_sqlite_logging
 
+# Background thread that writes queued records to the log file
+_file_listener: Optional[logging.handlers.QueueListener] = None
+
 
 def get_default_log_dir() -> Path:
     """Get the default log directory based on OS standards"""
@@ -30,6 +35,33 @@ def get_default_log_dir() -> Path:
         return Path.home() / ".mcp-servers" / "logs"
 
 
+def _stop_file_listener() -> None:
+    """Flush any queued file records and stop the background writer."""
+    global _file_listener
+    if _file_listener is not None:
+        _file_listener.stop()
+        _file_listener = None
+
+
+atexit.register(_stop_file_listener)
+
+
+def _queue_file_handler(file_handler: logging.Handler) -> logging.Handler:
+    """Hand records for file_handler to a background writer thread.
+    
+    Returns a QueueHandler to attach in place of file_handler, so logging
+    calls only enqueue and disk writes happen off the calling thread.
+    """
+    global _file_listener
+    _stop_file_listener()
+    log_queue = queue.SimpleQueue()
+    _file_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, respect_handler_level=True
+    )
+    _file_listener.start()
+    return logging.handlers.QueueHandler(log_queue)
+
+
 def setup_logging(server_config: Optional[ServerConfig] = None) -> None:
     """Configure logging for the Example Server MCP server"""
     # Get log level from server config, environment, or default to INFO
@@ -92,13 +124,14 @@ def setup_logging(server_config: Optional[ServerConfig] = None) -> None:
     log_path.mkdir(parents=True, exist_ok=True)
     log_file = log_path / "example_server.log"
 
-    # Add rotating file handler (10MB files, keep 5 backups)
+    # Add rotating file handler (10MB files, keep 5 backups), written
+    # from a background thread
     file_handler = logging.handlers.RotatingFileHandler(
         log_file, maxBytes=10_000_000, backupCount=5, encoding="utf-8"
     )
     file_handler.setLevel(effective_level)
     file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
+    root_logger.addHandler(_queue_file_handler(file_handler))
 
     # Set levels for all loggers
     for logger in [
@@ -3,6 +3,16 @@
 This module provides the MCP server instance for CLI discovery and client integration.
 """
 
-from example_server.server.app import server, create_mcp_server
+from typing import Any
 
-__all__ = ["server", "create_mcp_server"]
\ No newline at end of file
+from example_server.server import app as _app
+from example_server.server.app import create_mcp_server
+
+__all__ = ["server", "create_mcp_server"]
+
+
+def __getattr__(name: str) -> Any:
+    """Forward ``server`` to the lazy hook in app, so importing the package doesn't build it."""
+    if name == "server":
+        return _app.server
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,16 +3,30 @@
 This module implements the core MCP server using FastMCP with multi-transport support
 (STDIO, SSE, and Streamable HTTP) and automatic application of SAAGA decorators 
 (exception handling, logging, parallelization).
+
+Setting EXAMPLE_SERVER_UVLOOP=1 runs the server on uvloop when it is installed,
+which lowers the per-await scheduling overhead of I/O-bound tools.
 """
 
 import asyncio
+import logging
+import os
 import sys
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, List
 
 import click
 from mcp import types
 from mcp.server.fastmcp import FastMCP
 
+try:
+    import uvloop
+except ImportError:
+    # Optional (and unavailable on Windows) - fall back to the default loop
+    uvloop = None
+
+# Environment variable that opts the server into uvloop
+UVLOOP_ENV_VAR = "EXAMPLE_SERVER_UVLOOP"
+
 from example_server.config import ServerConfig, get_config
 from example_server.logging_config import setup_logging, logger
 from example_server.log_system.correlation import (
@@ -20,19 +34,38 @@ from example_server.log_system.correlation import (
     set_initialization_correlation_id,
     clear_initialization_correlation_id
 )
+from example_server.log_system.destinations import DestinationConfig
 from example_server.log_system.unified_logger import UnifiedLogger
+from example_server.decorators.exception_handler import exception_handler
+from example_server.decorators.tool_logger import tool_logger
+from example_server.decorators.type_converter import type_converter
+from example_server.decorators.parallelize import parallelize
+from example_server.decorators.oauth_passthrough import oauth_passthrough
 from example_server.tools.example_tools import example_tools, parallel_example_tools
-from example_server.tools.github_passthrough_tools import oauth_passthrough_tools
+from example_server.tools.github_passthrough_tools import oauth_passthrough_tools, close_github_client
+
+# Server built from the global configuration, shared by every caller that
+# doesn't pass its own config
+_default_server: Optional[FastMCP] = None
+
+
 def create_mcp_server(config: Optional[ServerConfig] = None) -> FastMCP:
     """Create and configure the MCP server with SAAGA decorators.
     
+    Calls without a config return the same server instance, so logging
+    initialization and tool registration only run once per process.
+    
     Args:
         config: Optional server configuration
         
     Returns:
         Configured FastMCP server instance
     """
-    if config is None:
+    global _default_server
+    use_default = config is None
+    if use_default:
+        if _default_server is not None:
+            return _default_server
         config = get_config()
     
     # Set startup correlation ID BEFORE initializing logging
@@ -41,15 +74,13 @@ def create_mcp_server(config: Optional[ServerConfig] = None) -> FastMCP:
     
     # Initialize unified logging using factory pattern
     # Convert logging_destinations dict to DestinationConfig objects
-    from example_server.log_system.destinations import DestinationConfig
-    
     destinations_list = []
     if config.logging_destinations and 'destinations' in config.logging_destinations:
         for dest_dict in config.logging_destinations['destinations']:
             dest_config = DestinationConfig(
                 type=dest_dict.get('type', 'sqlite'),
                 enabled=dest_dict.get('enabled', True),
-                settings=dest_dict.get('settings', {})
+                settings=dest_dict.get('settings') or {}
             )
             destinations_list.append(dest_config)
     
@@ -64,7 +95,6 @@ def create_mcp_server(config: Optional[ServerConfig] = None) -> FastMCP:
     # setup_logging(config)  # Temporarily disabled to test unified logging
     
     # Log startup info using unified logger
-    import logging
     unified_logger = logging.getLogger('example_server')
     unified_logger.info(f"Unified logging initialized with {len(UnifiedLogger.get_available_destinations())} available destination types")
     unified_logger.info(f"Server config: {config.name} at log level {config.log_level}")
@@ -77,6 +107,9 @@ def create_mcp_server(config: Optional[ServerConfig] = None) -> FastMCP:
     unified_logger.info("Server initialization complete")
     clear_initialization_correlation_id()
     
+    if use_default:
+        _default_server = mcp_server
+    
     return mcp_server
 
 
@@ -88,15 +121,11 @@ def register_tools(mcp_server: FastMCP, config: ServerConfig) -> None:
     """
     
     # Get unified logger for registration logs
-    import logging
     unified_logger = logging.getLogger('example_server')
     
-    # Import SAAGA decorators
-    from example_server.decorators.exception_handler import exception_handler
-    from example_server.decorators.tool_logger import tool_logger
-    from example_server.decorators.type_converter import type_converter
-    from example_server.decorators.parallelize import parallelize
-    from example_server.decorators.oauth_passthrough import oauth_passthrough
+    # Names are collected and logged once at the end instead of per tool
+    registered_names: List[str] = []
+    
     # Register regular tools with SAAGA decorators
     for tool_func in example_tools:
         # Apply SAAGA decorator chain: exception_handler → tool_logger → type_converter
@@ -111,7 +140,7 @@ def register_tools(mcp_server: FastMCP, config: ServerConfig) -> None:
             name=tool_name
         )(decorated_func)
         
-        unified_logger.info(f"Registered tool: {tool_name}")
+        registered_names.append(tool_name)
     
     # Register parallel tools with SAAGA decorators  
     for tool_func in parallel_example_tools:
@@ -127,7 +156,7 @@ def register_tools(mcp_server: FastMCP, config: ServerConfig) -> None:
             name=tool_name
         )(decorated_func)
         
-        unified_logger.info(f"Registered parallel tool: {tool_name}")
+        registered_names.append(f"{tool_name} (parallel)")
     # Register OAuth passthrough tools with SAAGA decorators
     # Tools provide (provider, function) tuples so app.py remains tool-agnostic
     for provider, tool_func in oauth_passthrough_tools:
@@ -147,10 +176,24 @@ def register_tools(mcp_server: FastMCP, config: ServerConfig) -> None:
             name=tool_func.__name__
         )(decorated_func)
         
-        unified_logger.info(f"Registered OAuth passthrough tool: {tool_func.__name__} (provider: {provider})")
+        registered_names.append(f"{tool_func.__name__} (OAuth passthrough: {provider})")
+    unified_logger.info(f"Registered {len(registered_names)} tools: {', '.join(registered_names)}")
     unified_logger.info(f"Server '{mcp_server.name}' initialized with SAAGA decorators")
-# Create a server instance that can be imported by the MCP CLI
-server = create_mcp_server()
+
+
+# PEP 562 module __getattr__: ``server`` is not a real module attribute but is
+# built on first access, e.g. when the MCP CLI imports this module and reads
+# ``server``. The package and ``server`` package __init__ modules forward to it.
+def __getattr__(name: str) -> Any:
+    """Build the default server instance when ``server`` is first accessed.
+    
+    Importing this module stays cheap; logging setup and tool
+    registration only run once something asks for ``server``.
+    """
+    if name == "server":
+        return create_mcp_server()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 @click.command()
 @click.option(
@@ -166,6 +209,8 @@ server = create_mcp_server()
 )
 def main(port: int, transport: str) -> int:
     """Run the Example Server server with specified transport."""
+    server = create_mcp_server()
+    
     async def run_server():
         """Inner async function to run the server and manage the event loop."""
         # Set the event loop in UnifiedLogger for async operations
@@ -187,11 +232,20 @@ def main(port: int, transport: str) -> int:
             else:
                 raise ValueError(f"Unknown transport: {transport}")
         finally:
+            # Close pooled connections held by the GitHub tools
+            await close_github_client()
             # Clean up unified logger
             await UnifiedLogger.close()
     
+    use_uvloop = os.environ.get(UVLOOP_ENV_VAR, "").lower() in ("1", "true", "yes")
+    if use_uvloop and uvloop is None:
+        logger.warning(f"{UVLOOP_ENV_VAR} is set but uvloop is not installed; using the default event loop")
+    
     try:
-        asyncio.run(run_server())
+        if use_uvloop and uvloop is not None:
+            uvloop.run(run_server())
+        else:
+            asyncio.run(run_server())
         return 0
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
@@ -6,6 +6,7 @@ with the server and decorated with exception handling, logging, and optional
 parallelization.
 """
 
+import asyncio
 import time
 import random
 from typing import List, Dict, Any
@@ -212,7 +213,6 @@ async def process_batch_data(items: List[str], operation: str = "upper", ctx: Co
         Processed items with metadata
     """
     # Simulate some processing time
-    import asyncio
     await asyncio.sleep(0.1)
     
     processed_items = []
@@ -260,7 +260,6 @@ async def simulate_heavy_computation(complexity: int = 5, ctx: Context = None) -
         result += i * 2
         if i % 10000 == 0:
             # Yield control to allow other tasks to run
-            import asyncio
             await asyncio.sleep(0.001)
     
     computation_time = time.time() - start_time
@@ -310,8 +309,6 @@ async def get_tool_info() -> Dict[str, Any]:
 
 if __name__ == "__main__":
     # Test tools functionality
-    import asyncio
-    
     async def test_tools():
         print("Tool Information:")
         print(await get_tool_info())
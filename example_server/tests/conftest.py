@@ -16,7 +16,10 @@ def ensure_coverage_tracking():
     yield
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def anyio_backend():
-    """Configure anyio to use asyncio backend."""
+    """Configure anyio to use asyncio backend.
+    
+    Session-scoped so session-scoped async fixtures (mcp_session) can use it.
+    """
     return "asyncio"
\ No newline at end of file
@@ -19,7 +19,7 @@ import json
 from typing import Optional, Dict, Any, List
 import pytest
 from mcp import types
-from .conftest import extract_text_content, extract_error_text
+from .conftest import extract_text_content, extract_error_text, parse_tool_json, parse_tool_json_items
 
 
 # Use anyio instead of pytest-asyncio to match SDK approach
@@ -29,13 +29,12 @@ pytestmark = pytest.mark.anyio
 class TestMCPToolDiscovery:
     """Test MCP tool discovery functionality."""
     
-    async def test_all_tools_discoverable(self, mcp_session):
+    async def test_all_tools_discoverable(self, tools_response):
         """Test that all expected tools are discoverable via list_tools().
         
         This test runs with both STDIO and Streamable HTTP transports.
         """
-        session, transport = mcp_session
-        tools_response = await session.list_tools()
+        tools_response, transport = tools_response
         
         # Extract tool names
         tool_names = [tool.name for tool in tools_response.tools]
@@ -59,13 +58,12 @@ class TestMCPToolDiscovery:
         for expected in expected_tools:
             assert expected in tool_names, f"Tool {expected} not found in {tool_names} (transport: {transport})"
     
-    async def test_no_kwargs_in_tool_schemas(self, mcp_session):
+    async def test_no_kwargs_in_tool_schemas(self, tools_response):
         """Test that no tool has a 'kwargs' parameter (MCP compatibility).
         
         This test runs with both STDIO and Streamable HTTP transports.
         """
-        session, transport = mcp_session
-        tools_response = await session.list_tools()
+        tools_response, transport = tools_response
         
         for tool in tools_response.tools:
             if tool.inputSchema:
@@ -74,13 +72,12 @@ class TestMCPToolDiscovery:
                     f"Tool {tool.name} has kwargs parameter which breaks MCP compatibility (transport: {transport})"
                 )
     
-    async def test_tool_metadata_present(self, mcp_session):
+    async def test_tool_metadata_present(self, tools_response):
         """Test that tools have proper metadata (description, schema).
         
         This test runs with both STDIO and Streamable HTTP transports.
         """
-        session, transport = mcp_session
-        tools_response = await session.list_tools()
+        tools_response, transport = tools_response
         
         for tool in tools_response.tools:
             # Every tool should have a description
@@ -96,6 +93,45 @@ class TestMCPToolDiscovery:
 class TestMCPToolExecution:
     """Test MCP tool execution with various parameter scenarios."""
     
+    async def test_tool_execution_smoke_batch(self, mcp_session):
+        """Smoke-test the example tools with one concurrent fan-out.
+        
+        The calls are independent, so they are sent together and each result
+        is checked by its validator afterwards (gather keeps call order). The
+        detailed per-tool tests below are marked slow; run with
+        ``-m "not slow"`` for a quick pass that relies on this test instead.
+        
+        This test runs with both STDIO and Streamable HTTP transports.
+        """
+        session, transport = mcp_session
+        cases = [
+            ("echo_tool", {"message": "Hello MCP World"},
+             lambda result: "Hello MCP World" in extract_text_content(result)),
+            ("get_time", {},
+             lambda result: any(keyword in extract_text_content(result).lower()
+                                for keyword in ["time", ":", "am", "pm", "utc"])),
+            ("random_number", {},
+             lambda result: 1 <= parse_tool_json(result)["number"] <= 100),
+            ("random_number", {"min_value": "10", "max_value": "20"},
+             lambda result: 10 <= parse_tool_json(result)["number"] <= 20),
+            ("calculate_fibonacci", {"n": "10"},
+             lambda result: parse_tool_json(result)["value"] == 55),
+            ("process_batch_data", {"kwargs_list": [{"items": ["hello"], "operation": "upper"}]},
+             lambda result: parse_tool_json(result)["processed"] == ["HELLO"]),
+        ]
+        
+        results = await asyncio.gather(
+            *(session.call_tool(tool_name, arguments) for tool_name, arguments, _ in cases)
+        )
+        
+        for (tool_name, arguments, validate), result in zip(cases, results):
+            assert not result.isError, f"Tool {tool_name} failed: {result} (transport: {transport})"
+            assert validate(result), (
+                f"Unexpected {tool_name} response for {arguments}: "
+                f"{extract_text_content(result)} (transport: {transport})"
+            )
+    
+    @pytest.mark.slow
     async def test_echo_tool_execution(self, mcp_session):
         """Test echo_tool works correctly via MCP client.
         
@@ -114,6 +150,7 @@ class TestMCPToolExecution:
         assert text_content is not None, f"No text content found (transport: {transport})"
         assert "Hello MCP World" in text_content, f"Expected message not in response: {text_content} (transport: {transport})"
     
+    @pytest.mark.slow
     async def test_get_time_execution(self, mcp_session):
         """Test get_time tool execution.
         
@@ -132,6 +169,7 @@ class TestMCPToolExecution:
             f"Response doesn't appear to contain time: {text_content} (transport: {transport})"
         )
     
+    @pytest.mark.slow
     async def test_random_number_with_defaults(self, mcp_session):
         """Test random_number tool with default parameters.
         
@@ -145,7 +183,7 @@ class TestMCPToolExecution:
         text_content = extract_text_content(result)
         # Try to parse the response as JSON (tools return structured data)
         try:
-            data = json.loads(text_content)
+            data = parse_tool_json(result)
             assert "number" in data, f"Response missing 'number' field: {data} (transport: {transport})"
             assert isinstance(data["number"], int), f"Number should be int: {data['number']} (transport: {transport})"
             assert 1 <= data["number"] <= 100, f"Number out of default range: {data['number']} (transport: {transport})"
@@ -153,6 +191,7 @@ class TestMCPToolExecution:
             # If not JSON, try to extract number directly
             pytest.fail(f"Could not parse response as JSON: {text_content} (transport: {transport})")
     
+    @pytest.mark.slow
     async def test_random_number_parameter_conversion(self, mcp_session):
         """Test string parameter conversion (MCP sends all params as strings).
         
@@ -169,12 +208,13 @@ class TestMCPToolExecution:
         
         text_content = extract_text_content(result)
         try:
-            data = json.loads(text_content)
+            data = parse_tool_json(result)
             number = data["number"]
             assert 10 <= number <= 20, f"Number {number} out of specified range [10, 20] (transport: {transport})"
         except (json.JSONDecodeError, KeyError, ValueError) as e:
             pytest.fail(f"Failed to parse response: {e}, content: {text_content} (transport: {transport})")
     
+    @pytest.mark.slow
     async def test_calculate_fibonacci_execution(self, mcp_session):
         """Test calculate_fibonacci with various inputs.
         
@@ -188,13 +228,14 @@ class TestMCPToolExecution:
         
         text_content = extract_text_content(result)
         try:
-            data = json.loads(text_content)
+            data = parse_tool_json(result)
             assert data["position"] == 10, f"Wrong position: {data} (transport: {transport})"
             assert data["value"] == 55, f"Wrong Fibonacci value for n=10: {data} (transport: {transport})"
         except (json.JSONDecodeError, KeyError) as e:
             pytest.fail(f"Failed to parse response: {e}, content: {text_content} (transport: {transport})")
     
     
+    @pytest.mark.slow
     async def test_process_batch_data_parallel_execution(self, mcp_session):
         """Test process_batch_data parallel tool execution.
         
@@ -215,14 +256,7 @@ class TestMCPToolExecution:
         assert not result.isError, f"Tool execution failed: {result}"
         
         # Parallel tools return multiple TextContent items, one for each result
-        # Extract all content items
-        results = []
-        for content in result.content:
-            if isinstance(content, types.TextContent):
-                try:
-                    results.append(json.loads(content.text))
-                except json.JSONDecodeError:
-                    pass
+        results = parse_tool_json_items(result)
         
         assert len(results) == 3, f"Expected 3 results, got {len(results)} (transport: {transport})"
         
@@ -249,13 +283,7 @@ class TestMCPToolExecution:
         assert not result.isError, f"Tool execution failed: {result}"
         
         # Parallel tools return multiple TextContent items, one for each result
-        results = []
-        for content in result.content:
-            if isinstance(content, types.TextContent):
-                try:
-                    results.append(json.loads(content.text))
-                except json.JSONDecodeError:
-                    pass
+        results = parse_tool_json_items(result)
         
         assert len(results) == 2, f"Expected 2 results, got {len(results)} (transport: {transport})"
         
@@ -324,7 +352,7 @@ class TestMCPErrorHandling:
         
         # Check for SAAGA error format
         try:
-            data = json.loads(text_content)
+            data = parse_tool_json(result)
             if isinstance(data, dict) and data.get("Status") == "Exception":
                 # Verify SAAGA error format
                 assert "Message" in data, f"SAAGA error missing Message (transport: {transport})"
@@ -378,7 +406,10 @@ class TestMCPProtocolCompliance:
     """Test MCP protocol compliance and edge cases."""
     
     async def test_multiple_tools_in_sequence(self, mcp_session):
-        """Test calling multiple tools in sequence.
+        """Test calling multiple tools on one session.
+        
+        The calls are independent, so they are sent together and the test
+        waits for the slowest one rather than the sum of all of them.
         
         This test runs with both STDIO and Streamable HTTP transports.
         """
@@ -390,8 +421,11 @@ class TestMCPProtocolCompliance:
             ("random_number", {"min_value": "1", "max_value": "10"}),
         ]
         
-        for tool_name, params in tools_to_test:
-            result = await session.call_tool(tool_name, params)
+        results = await asyncio.gather(
+            *(session.call_tool(tool_name, params) for tool_name, params in tools_to_test)
+        )
+        
+        for (tool_name, _), result in zip(tools_to_test, results):
             assert not result.isError, f"Tool {tool_name} failed: {result} (transport: {transport})"
             assert len(result.content) > 0, f"Tool {tool_name} returned no content (transport: {transport})"
     
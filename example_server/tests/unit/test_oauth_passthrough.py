@@ -3,7 +3,12 @@
 Tests the decorator and tools WITHOUT making actual API calls.
 """
 
+import asyncio
+import httpx
+import json
 import pytest
+import time
+from email.utils import formatdate
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from typing import Dict, Any
 
@@ -11,8 +16,15 @@ from example_server.decorators.oauth_passthrough import oauth_passthrough
 from example_server.tools.github_passthrough_tools import (
     get_github_user,
     list_user_repos,
+    get_github_repos,
     create_github_issue,
-    oauth_passthrough_tools
+    oauth_passthrough_tools,
+    _get_client,
+    close_github_client,
+    _rate_limit_delay,
+    MAX_REPOS_PER_CALL,
+    _current_token,
+    _AUTH
 )
 
 
@@ -22,7 +34,7 @@ class TestToolOrganization:
     def test_oauth_passthrough_tools_structure(self):
         """Verify OAuth tools are organized with provider information."""
         # Should be list of (provider, function) tuples
-        assert len(oauth_passthrough_tools) == 3
+        assert len(oauth_passthrough_tools) == 4
         
         # Check each tool has correct structure
         for provider, tool_func in oauth_passthrough_tools:
@@ -33,20 +45,33 @@ class TestToolOrganization:
         tool_funcs = [func for _, func in oauth_passthrough_tools]
         assert get_github_user in tool_funcs
         assert list_user_repos in tool_funcs
+        assert get_github_repos in tool_funcs
         assert create_github_issue in tool_funcs
 
 
+class _FakeTool:
+    """Async tool stand-in that records its calls, lighter than AsyncMock."""
+    
+    def __init__(self, result: Any = None):
+        self.result = result
+        self.calls = []
+    
+    async def __call__(self, *args, **kwargs) -> Any:
+        self.calls.append((args, kwargs))
+        return self.result
+
+
 class TestOAuthPassthroughDecorator:
     """Test the oauth_passthrough decorator behavior."""
     
     @pytest.mark.asyncio
     async def test_decorator_with_valid_token(self):
         """Test decorator passes through when token is present."""
-        # Create a mock function
-        mock_func = AsyncMock(return_value={"status": "success"})
+        # Create a fake tool
+        fake_tool = _FakeTool({"status": "success"})
         
         # Apply the decorator
-        decorated = oauth_passthrough("github")(mock_func)
+        decorated = oauth_passthrough("github")(fake_tool)
         
         # Create mock context with token
         mock_ctx = Mock()
@@ -61,7 +86,7 @@ class TestOAuthPassthroughDecorator:
         result = await decorated(ctx=mock_ctx)
         
         # Verify the original function was called
-        mock_func.assert_called_once_with(ctx=mock_ctx)
+        assert fake_tool.calls == [((), {"ctx": mock_ctx})]
         assert result == {"status": "success"}
         
         # Verify token was added to meta
@@ -71,11 +96,11 @@ class TestOAuthPassthroughDecorator:
     @pytest.mark.asyncio
     async def test_decorator_without_token(self):
         """Test decorator returns error when token is missing."""
-        # Create a mock function
-        mock_func = AsyncMock(return_value={"status": "success"})
+        # Create a fake tool
+        fake_tool = _FakeTool({"status": "success"})
         
         # Apply the decorator
-        decorated = oauth_passthrough("github")(mock_func)
+        decorated = oauth_passthrough("github")(fake_tool)
         
         # Create mock context WITHOUT token
         mock_ctx = Mock()
@@ -88,7 +113,7 @@ class TestOAuthPassthroughDecorator:
         result = await decorated(ctx=mock_ctx)
         
         # Verify the original function was NOT called
-        mock_func.assert_not_called()
+        assert fake_tool.calls == []
         
         # Verify error response
         assert result["error"] == "token_not_provided"
@@ -98,17 +123,17 @@ class TestOAuthPassthroughDecorator:
     @pytest.mark.asyncio
     async def test_decorator_without_context(self):
         """Test decorator returns error when context is missing."""
-        # Create a mock function
-        mock_func = AsyncMock(return_value={"status": "success"})
+        # Create a fake tool
+        fake_tool = _FakeTool({"status": "success"})
         
         # Apply the decorator
-        decorated = oauth_passthrough("github")(mock_func)
+        decorated = oauth_passthrough("github")(fake_tool)
         
         # Call without context
         result = await decorated()
         
         # Verify the original function was NOT called
-        mock_func.assert_not_called()
+        assert fake_tool.calls == []
         
         # Verify error response
         assert result["error"] == "token_not_provided"
@@ -117,11 +142,11 @@ class TestOAuthPassthroughDecorator:
     @pytest.mark.asyncio
     async def test_decorator_with_wrong_provider_token(self):
         """Test decorator returns error when token is for different provider."""
-        # Create a mock function
-        mock_func = AsyncMock(return_value={"status": "success"})
+        # Create a fake tool
+        fake_tool = _FakeTool({"status": "success"})
         
         # Apply the decorator for GitHub
-        decorated = oauth_passthrough("github")(mock_func)
+        decorated = oauth_passthrough("github")(fake_tool)
         
         # Create mock context with Google token only
         mock_ctx = Mock()
@@ -136,53 +161,58 @@ class TestOAuthPassthroughDecorator:
         result = await decorated(ctx=mock_ctx)
         
         # Verify the original function was NOT called
-        mock_func.assert_not_called()
+        assert fake_tool.calls == []
         
         # Verify error response
         assert result["error"] == "token_not_provided"
         assert "github" in result["message"].lower()
 
 
+@pytest.fixture
+def mock_github_client():
+    """Patch the shared GitHub client and build a context carrying a token.
+    
+    Yields:
+        Tuple of (mock_client, mock_ctx); tests only set the responses.
+    """
+    mock_client = AsyncMock()
+    
+    mock_ctx = Mock()
+    mock_ctx.request_context = Mock()
+    mock_ctx.request_context.meta = MagicMock()
+    mock_ctx.request_context.meta.get.return_value = "gho_test_token_123"
+    
+    with patch('example_server.tools.github_passthrough_tools._get_client', return_value=mock_client):
+        yield mock_client, mock_ctx
+
+
 class TestGitHubPassthroughTools:
     """Test GitHub tools with mocked API calls."""
     
     @pytest.mark.asyncio
-    @patch('example_server.tools.github_passthrough_tools.httpx.AsyncClient')
-    async def test_get_github_user_success(self, mock_client_class):
+    async def test_get_github_user_success(self, mock_github_client):
         """Test get_github_user with valid token."""
+        mock_client, mock_ctx = mock_github_client
+        
         # Mock the HTTP response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "login": "testuser",
             "id": 12345,
             "name": "Test User",
             "email": "test@example.com"
-        }
+        }).encode()
         
-        # Mock the client
-        mock_client = AsyncMock()
         mock_client.get = AsyncMock(return_value=mock_response)
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-        
-        # Create mock context with token
-        mock_ctx = Mock()
-        mock_ctx.request_context = Mock()
-        mock_ctx.request_context.meta = MagicMock()
-        mock_ctx.request_context.meta.get.return_value = "gho_test_token_123"
         
         # Call the function
         result = await get_github_user(ctx=mock_ctx)
         
         # Verify API was called correctly
         mock_client.get.assert_called_once_with(
-            "https://api.github.com/user",
-            headers={
-                "Authorization": "Bearer gho_test_token_123",
-                "Accept": "application/vnd.github+json",
-                "X-GitHub-Api-Version": "2022-11-28"
-            },
-            timeout=10.0
+            "/user",
+            auth=_AUTH
         )
         
         # Verify result
@@ -190,23 +220,17 @@ class TestGitHubPassthroughTools:
         assert result["id"] == 12345
     
     @pytest.mark.asyncio
-    @patch('example_server.tools.github_passthrough_tools.httpx.AsyncClient')
-    async def test_get_github_user_unauthorized(self, mock_client_class):
+    async def test_get_github_user_unauthorized(self, mock_github_client):
         """Test get_github_user with invalid token."""
+        mock_client, mock_ctx = mock_github_client
+        
         # Mock 401 response
         mock_response = Mock()
         mock_response.status_code = 401
         mock_response.text = "Unauthorized"
         
-        # Mock the client
-        mock_client = AsyncMock()
         mock_client.get = AsyncMock(return_value=mock_response)
-        mock_client_class.return_value.__aenter__.return_value = mock_client
         
-        # Create mock context with token
-        mock_ctx = Mock()
-        mock_ctx.request_context = Mock()
-        mock_ctx.request_context.meta = MagicMock()
         mock_ctx.request_context.meta.get.return_value = "invalid_token"
         
         # Call the function
@@ -228,13 +252,25 @@ class TestGitHubPassthroughTools:
         assert "context not available" in result["message"].lower()
     
     @pytest.mark.asyncio
-    @patch('example_server.tools.github_passthrough_tools.httpx.AsyncClient')
-    async def test_list_user_repos_success(self, mock_client_class):
+    async def test_get_github_user_no_meta(self):
+        """Test get_github_user when the request carries no metadata."""
+        mock_ctx = Mock()
+        mock_ctx.request_context.meta = None
+        
+        result = await get_github_user(ctx=mock_ctx)
+        
+        assert result["error"] == "token_not_provided"
+        assert result["provider"] == "github"
+    
+    @pytest.mark.asyncio
+    async def test_list_user_repos_success(self, mock_github_client):
         """Test list_user_repos with valid token."""
+        mock_client, mock_ctx = mock_github_client
+        
         # Mock the HTTP response
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.json.return_value = [
+        mock_response.content = json.dumps([
             {
                 "name": "repo1",
                 "full_name": "user/repo1",
@@ -255,36 +291,22 @@ class TestGitHubPassthroughTools:
                 "stargazers_count": 5,
                 "updated_at": "2024-01-02T00:00:00Z"
             }
-        ]
+        ]).encode()
         
-        # Mock the client
-        mock_client = AsyncMock()
         mock_client.get = AsyncMock(return_value=mock_response)
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-        
-        # Create mock context with token
-        mock_ctx = Mock()
-        mock_ctx.request_context = Mock()
-        mock_ctx.request_context.meta = MagicMock()
-        mock_ctx.request_context.meta.get.return_value = "gho_test_token_123"
         
         # Call the function
         result = await list_user_repos(per_page=10, page=1, ctx=mock_ctx)
         
         # Verify API was called correctly
         mock_client.get.assert_called_once_with(
-            "https://api.github.com/user/repos",
-            headers={
-                "Authorization": "Bearer gho_test_token_123",
-                "Accept": "application/vnd.github+json",
-                "X-GitHub-Api-Version": "2022-11-28"
-            },
+            "/user/repos",
+            auth=_AUTH,
             params={
                 "per_page": 10,
                 "page": 1,
                 "sort": "updated"
-            },
-            timeout=10.0
+            }
         )
         
         # Verify result
@@ -294,13 +316,94 @@ class TestGitHubPassthroughTools:
         assert result["repositories"][1]["private"] == True
     
     @pytest.mark.asyncio
-    @patch('example_server.tools.github_passthrough_tools.httpx.AsyncClient')
-    async def test_create_github_issue_success(self, mock_client_class):
+    async def test_get_github_repos_bulk(self, mock_github_client):
+        """Test get_github_repos fetches every repository and keys results by name."""
+        mock_client, mock_ctx = mock_github_client
+        
+        found = Mock()
+        found.status_code = 200
+        found.content = json.dumps({"name": "repo1", "full_name": "user/repo1", "private": False}).encode()
+        missing = Mock()
+        missing.status_code = 404
+        
+        async def fake_get(url, auth):
+            return found if url == "/repos/user/repo1" else missing
+        
+        mock_client.get = AsyncMock(side_effect=fake_get)
+        
+        result = await get_github_repos(repos=["user/repo1", "user/missing"], ctx=mock_ctx)
+        
+        assert mock_client.get.call_count == 2
+        assert result["count"] == 2
+        assert result["results"]["user/repo1"]["full_name"] == "user/repo1"
+        assert result["results"]["user/missing"]["error"] == "not_found"
+    
+    @pytest.mark.asyncio
+    async def test_get_github_repos_validates_names(self, mock_github_client):
+        """Test get_github_repos de-duplicates names and rejects malformed ones."""
+        mock_client, mock_ctx = mock_github_client
+        
+        found = Mock()
+        found.status_code = 200
+        found.content = json.dumps({"name": "repo1", "full_name": "user/repo1", "private": False}).encode()
+        mock_client.get = AsyncMock(return_value=found)
+        
+        repos = ["user/repo1", "user/..", "user/repo1", "user/repo1/issues", "user/repo1?x=1"]
+        result = await get_github_repos(repos=repos, ctx=mock_ctx)
+        
+        mock_client.get.assert_called_once_with("/repos/user/repo1", auth=_AUTH)
+        assert list(result["results"]) == ["user/repo1", "user/..", "user/repo1/issues", "user/repo1?x=1"]
+        for name in ["user/..", "user/repo1/issues", "user/repo1?x=1"]:
+            assert result["results"][name]["error"] == "invalid_repo_name"
+        
+        result = await get_github_repos(repos=["user/repo"] * (MAX_REPOS_PER_CALL + 1), ctx=mock_ctx)
+        assert result["error"] == "too_many_repos"
+        assert mock_client.get.call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_get_github_repos_unauthorized(self, mock_github_client):
+        """Test a rejected token is reported once at the top level."""
+        mock_client, mock_ctx = mock_github_client
+        
+        mock_response = Mock()
+        mock_response.status_code = 401
+        mock_response.text = "Unauthorized"
+        mock_client.get = AsyncMock(return_value=mock_response)
+        
+        result = await get_github_repos(repos=["user/repo1", "user/repo2"], ctx=mock_ctx)
+        
+        assert result["error"] == "unauthorized"
+        assert result["status_code"] == 401
+    
+    @pytest.mark.asyncio
+    async def test_get_github_repos_client_failure(self, mock_github_client):
+        """Test a failure to create the client is returned as a tool error."""
+        _, mock_ctx = mock_github_client
+        
+        with patch('example_server.tools.github_passthrough_tools._get_client', side_effect=RuntimeError("no client")):
+            result = await get_github_repos(repos=["user/repo1"], ctx=mock_ctx)
+        
+        assert result["error"] == "request_failed"
+        assert "no client" in result["message"]
+    
+    @pytest.mark.asyncio
+    async def test_get_github_repos_cancelled_fetch(self, mock_github_client):
+        """Test a cancelled fetch cancels the call instead of becoming a result."""
+        mock_client, mock_ctx = mock_github_client
+        mock_client.get = AsyncMock(side_effect=asyncio.CancelledError())
+        
+        with pytest.raises(asyncio.CancelledError):
+            await get_github_repos(repos=["user/repo1"], ctx=mock_ctx)
+    
+    @pytest.mark.asyncio
+    async def test_create_github_issue_success(self, mock_github_client):
         """Test create_github_issue with valid token."""
+        mock_client, mock_ctx = mock_github_client
+        
         # Mock the HTTP response
         mock_response = Mock()
         mock_response.status_code = 201
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "number": 42,
             "title": "Test Issue",
             "html_url": "https://github.com/owner/repo/issues/42",
@@ -309,18 +412,9 @@ class TestGitHubPassthroughTools:
             "body": "Test issue body",
             "labels": [{"name": "bug"}, {"name": "help wanted"}],
             "assignees": [{"login": "user1"}]
-        }
+        }).encode()
         
-        # Mock the client
-        mock_client = AsyncMock()
         mock_client.post = AsyncMock(return_value=mock_response)
-        mock_client_class.return_value.__aenter__.return_value = mock_client
-        
-        # Create mock context with token
-        mock_ctx = Mock()
-        mock_ctx.request_context = Mock()
-        mock_ctx.request_context.meta = MagicMock()
-        mock_ctx.request_context.meta.get.return_value = "gho_test_token_123"
         
         # Call the function
         result = await create_github_issue(
@@ -334,21 +428,17 @@ class TestGitHubPassthroughTools:
         )
         
         # Verify API was called correctly
-        mock_client.post.assert_called_once_with(
-            "https://api.github.com/repos/owner/repo/issues",
-            headers={
-                "Authorization": "Bearer gho_test_token_123",
-                "Accept": "application/vnd.github+json",
-                "X-GitHub-Api-Version": "2022-11-28"
-            },
-            json={
-                "title": "Test Issue",
-                "body": "Test issue body",
-                "labels": ["bug", "help wanted"],
-                "assignees": ["user1"]
-            },
-            timeout=10.0
-        )
+        mock_client.post.assert_called_once()
+        args, kwargs = mock_client.post.call_args
+        assert args == ("/repos/owner/repo/issues",)
+        assert kwargs["auth"] is _AUTH
+        assert kwargs["headers"] == {"Content-Type": "application/json"}
+        assert json.loads(kwargs["content"]) == {
+            "title": "Test Issue",
+            "body": "Test issue body",
+            "labels": ["bug", "help wanted"],
+            "assignees": ["user1"]
+        }
         
         # Verify result
         assert result["number"] == 42
@@ -358,23 +448,18 @@ class TestGitHubPassthroughTools:
         assert result["assignees"] == ["user1"]
     
     @pytest.mark.asyncio
-    @patch('example_server.tools.github_passthrough_tools.httpx.AsyncClient')
-    async def test_create_github_issue_forbidden(self, mock_client_class):
+    async def test_create_github_issue_forbidden(self, mock_github_client):
         """Test create_github_issue without permission."""
+        mock_client, mock_ctx = mock_github_client
+        
         # Mock 403 response
         mock_response = Mock()
         mock_response.status_code = 403
         mock_response.text = "Forbidden"
+        mock_response.headers = {}
         
-        # Mock the client
-        mock_client = AsyncMock()
         mock_client.post = AsyncMock(return_value=mock_response)
-        mock_client_class.return_value.__aenter__.return_value = mock_client
         
-        # Create mock context with token
-        mock_ctx = Mock()
-        mock_ctx.request_context = Mock()
-        mock_ctx.request_context.meta = MagicMock()
         mock_ctx.request_context.meta.get.return_value = "gho_limited_token"
         
         # Call the function
@@ -389,6 +474,96 @@ class TestGitHubPassthroughTools:
         assert result["error"] == "forbidden"
         assert result["status_code"] == 403
         assert "permission" in result["message"].lower()
+    
+    @pytest.mark.asyncio
+    @patch('example_server.tools.github_passthrough_tools.asyncio.sleep', new_callable=AsyncMock)
+    async def test_rate_limited_request_is_retried(self, mock_sleep, mock_github_client):
+        """Test a 429 response is retried after the advertised Retry-After delay."""
+        mock_client, mock_ctx = mock_github_client
+        
+        limited = Mock()
+        limited.status_code = 429
+        limited.headers = {"retry-after": "2"}
+        ok = Mock()
+        ok.status_code = 200
+        ok.content = json.dumps({"login": "testuser"}).encode()
+        
+        mock_client.get = AsyncMock(side_effect=[limited, ok])
+        
+        result = await get_github_user(ctx=mock_ctx)
+        
+        assert mock_client.get.call_count == 2
+        mock_sleep.assert_awaited_once_with(2.0)
+        assert result["login"] == "testuser"
+    
+    def test_rate_limit_delay_http_date(self):
+        """Test Retry-After in HTTP-date form, and the fallback when it is garbage."""
+        limited = Mock()
+        limited.status_code = 429
+        limited.headers = {"retry-after": formatdate(time.time() + 30, usegmt=True)}
+        
+        assert 25 <= _rate_limit_delay(limited, 0) <= 30
+        
+        limited.headers = {"retry-after": "soon"}
+        assert _rate_limit_delay(limited, 2) == 4.0
+    
+    def test_rate_limit_delay_garbage_reset(self):
+        """Test an unparseable X-RateLimit-Reset falls back to backoff."""
+        limited = Mock()
+        limited.status_code = 403
+        limited.headers = {"x-ratelimit-remaining": "0", "x-ratelimit-reset": "later"}
+        
+        assert _rate_limit_delay(limited, 1) == 2.0
+    
+    @pytest.mark.asyncio
+    @patch('example_server.tools.github_passthrough_tools.asyncio.sleep', new_callable=AsyncMock)
+    async def test_timed_out_request_is_retried(self, mock_sleep, mock_github_client):
+        """Test a GET that times out is retried, and a POST read timeout is not."""
+        mock_client, mock_ctx = mock_github_client
+        
+        ok = Mock()
+        ok.status_code = 200
+        ok.content = json.dumps({"login": "testuser"}).encode()
+        
+        mock_client.get = AsyncMock(side_effect=[httpx.ReadTimeout("read"), ok])
+        mock_client.post = AsyncMock(side_effect=httpx.ReadTimeout("read"))
+        
+        result = await get_github_user(ctx=mock_ctx)
+        assert mock_client.get.call_count == 2
+        assert result["login"] == "testuser"
+        
+        # Creating an issue twice is not safe, so a read timeout is returned as-is
+        result = await create_github_issue(owner="owner", repo="repo", title="Test Issue", ctx=mock_ctx)
+        assert mock_client.post.call_count == 1
+        assert result["error"] == "timeout"
+
+
+class TestSharedGitHubClient:
+    """Test the pooled GitHub API client used by the tools."""
+    
+    @pytest.mark.asyncio
+    async def test_client_reused_across_calls(self):
+        """The same client is returned until it is closed."""
+        try:
+            client = _get_client()
+            assert _get_client() is client
+            assert str(client.base_url) == "https://api.github.com"
+            
+            await close_github_client()
+            assert client.is_closed
+            assert _get_client() is not client
+        finally:
+            await close_github_client()
+    
+    def test_auth_uses_current_call_token(self):
+        """The shared auth hook sets the token of the tool call in progress."""
+        reset = _current_token.set("gho_test_token_123")
+        try:
+            request = httpx.Request("GET", "https://api.github.com/user")
+            next(_AUTH.auth_flow(request))
+            assert request.headers["Authorization"] == "Bearer gho_test_token_123"
+        finally:
+            _current_token.reset(reset)
 
 
 if __name__ == "__main__":
@@ -5,19 +5,28 @@ transport protocols (STDIO and Streamable HTTP).
 """
 
 import asyncio
+import json
 import os
 import sys
 import subprocess
 import time
 import signal
+import socket
 import atexit
 import psutil
 from pathlib import Path
-from typing import AsyncGenerator, Tuple, Optional, List
+from typing import Any, AsyncGenerator, Tuple, Optional, List
 import pytest
-from mcp import ClientSession, StdioServerParameters
+from mcp import ClientSession, StdioServerParameters, types
 from mcp.client.stdio import stdio_client, get_default_environment
 
+# orjson is optional; fall back to the standard library parser
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Conditional import for streamable_http
 try:
     from mcp.client.streamable_http import streamablehttp_client
@@ -37,8 +46,13 @@ class StreamableHTTPServer:
     # Class-level tracking of all server instances for cleanup
     _active_servers: List['StreamableHTTPServer'] = []
     
-    def __init__(self, port: int = {{ cookiecutter.server_port }}):
-        self.port = port
+    def __init__(self, port: Optional[int] = {{ cookiecutter.server_port }}):
+        """Create the manager for a fixed port, or an OS-picked one when port is None."""
+        # Only a fixed port can still be held by a server a crashed run left
+        # behind. A port the OS just handed out can't be, so the scan of every
+        # process's sockets is skipped for it.
+        self._reclaim_port = port is not None
+        self.port = port if port is not None else _free_port()
         self.process: Optional[subprocess.Popen] = None
         self.project_root = Path(__file__).parent.parent.parent
         self.server_module = "{{ cookiecutter.project_slug }}.server.app"
@@ -50,7 +64,8 @@ class StreamableHTTPServer:
             return
         
         # Kill any existing process on this port first
-        self._kill_port_processes()
+        if self._reclaim_port:
+            self._kill_port_processes()
         
         # Build environment
         env = os.environ.copy()
@@ -71,12 +86,28 @@ class StreamableHTTPServer:
             self._cleanup_registered = True
         
         # Wait for server to be ready
-        time.sleep(2)  # Give server time to start
+        self._wait_until_ready()
+    
+    def _wait_until_ready(self, timeout: float = 10.0) -> None:
+        """Poll the port until the server accepts connections.
         
-        # Check if process is still running
-        if self.process.poll() is not None:
-            stdout, stderr = self.process.communicate()
-            raise RuntimeError(f"Server failed to start. stdout: {stdout.decode()}, stderr: {stderr.decode()}")
+        Returns as soon as the server is listening instead of always
+        sleeping for a fixed start-up time.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            # Check if process is still running
+            if self.process.poll() is not None:
+                stdout, stderr = self.process.communicate()
+                raise RuntimeError(f"Server failed to start. stdout: {stdout.decode()}, stderr: {stderr.decode()}")
+            
+            try:
+                with socket.create_connection(("localhost", self.port), timeout=0.5):
+                    return
+            except OSError:
+                if time.monotonic() > deadline:
+                    raise RuntimeError(f"Server did not start listening on port {self.port} within {timeout}s")
+                time.sleep(0.05)
     
     def stop(self) -> None:
         """Stop the Streamable HTTP server with multiple fallback strategies."""
@@ -105,7 +136,8 @@ class StreamableHTTPServer:
         finally:
             self.process = None
             # Also kill any orphaned processes on the port
-            self._kill_port_processes()
+            if self._reclaim_port:
+                self._kill_port_processes()
             
             # Remove from active servers list
             if self._cleanup_registered and self in StreamableHTTPServer._active_servers:
@@ -150,12 +182,42 @@ class StreamableHTTPServer:
 atexit.register(StreamableHTTPServer.cleanup_all)
 
 
+def _free_port() -> int:
+    """Ask the OS for a port that is currently free."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
 # Skip streamable-http if not available
 TRANSPORTS = ["stdio"]
 if HAS_STREAMABLE_HTTP:
     TRANSPORTS.append("streamable-http")
 
-@pytest.fixture(params=TRANSPORTS)
+# MCP_TEST_TRANSPORTS (comma-separated) limits the run to the listed
+# transports, e.g. MCP_TEST_TRANSPORTS=streamable-http for a quick pass that
+# reuses the one session-wide HTTP server instead of spawning a stdio server
+_selected_transports = os.environ.get("MCP_TEST_TRANSPORTS")
+if _selected_transports:
+    _selected = {name.strip() for name in _selected_transports.split(",")}
+    TRANSPORTS = [transport for transport in TRANSPORTS if transport in _selected]
+
+
+@pytest.fixture(scope="session")
+def streamable_http_server() -> str:
+    """Start one Streamable HTTP server for the whole test session.
+    
+    Every module's streamable-http session connects to this server instead
+    of starting and stopping its own. The port is picked by the OS so runs
+    don't collide with anything already listening.
+    
+    Yields:
+        The server's MCP endpoint URL
+    """
+    with StreamableHTTPServer(port=None) as server:
+        yield f"http://localhost:{server.port}/mcp"
+
+@pytest.fixture(params=TRANSPORTS, scope="session")
 async def mcp_session(request) -> AsyncGenerator[Tuple[ClientSession, str], None]:
     """Provide an MCP client session for testing with multiple transports.
     
@@ -163,6 +225,11 @@ async def mcp_session(request) -> AsyncGenerator[Tuple[ClientSession, str], None
     transports automatically. Includes bulletproof cleanup that guarantees
     all resources are released even if tests fail catastrophically.
     
+    The session is session-scoped: the whole test run starts one server per
+    transport and every test module reuses it, instead of spawning a process
+    and repeating the MCP handshake per test or per module. The tools are
+    stateless, so tests sharing a session don't affect each other.
+    
     Args:
         request: pytest request object containing the transport parameter
         
@@ -172,19 +239,11 @@ async def mcp_session(request) -> AsyncGenerator[Tuple[ClientSession, str], None
     transport = request.param
     session = None
     cleanup_funcs = []
-    server_instance = None  # Track server for guaranteed cleanup
     stdio_proc = None  # Track stdio subprocess
     
     # Register pytest finalizer for guaranteed cleanup
     def emergency_cleanup():
         """Emergency cleanup that runs no matter what."""
-        # Clean up any streamable HTTP servers
-        if server_instance:
-            try:
-                server_instance.stop()
-            except Exception as e:
-                print(f"Emergency cleanup of server failed: {e}", file=sys.stderr)
-        
         # Clean up any stdio processes
         if stdio_proc:
             try:
@@ -255,16 +314,8 @@ async def mcp_session(request) -> AsyncGenerator[Tuple[ClientSession, str], None
             if not HAS_STREAMABLE_HTTP:
                 pytest.skip("streamable_http module not available")
             
-            # Setup Streamable HTTP transport
-            port = {{ cookiecutter.server_port }}
-            
-            # Start server in subprocess
-            server = StreamableHTTPServer(port)
-            server_instance = server  # Track for emergency cleanup
-            server.start()
-            
-            # Connect via Streamable HTTP
-            url = f"http://localhost:{port}/mcp"
+            # Connect to the session-wide Streamable HTTP server
+            url = request.getfixturevalue("streamable_http_server")
             http_context = streamablehttp_client(url)
             read, write, get_session_id = await http_context.__aenter__()
             
@@ -288,11 +339,6 @@ async def mcp_session(request) -> AsyncGenerator[Tuple[ClientSession, str], None
                     await http_context.__aexit__(None, None, None)
                 except Exception as e:
                     print(f"HTTP context cleanup error: {e}", file=sys.stderr)
-                    
-                try:
-                    server.stop()
-                except Exception as e:
-                    print(f"Server stop error: {e}", file=sys.stderr)
             
             cleanup_funcs.append(cleanup_http)
         
@@ -311,6 +357,20 @@ async def mcp_session(request) -> AsyncGenerator[Tuple[ClientSession, str], None
                 print(f"Cleanup error: {e}", file=sys.stderr)
 
 
+@pytest.fixture(scope="session")
+async def tools_response(mcp_session) -> Tuple[types.ListToolsResult, str]:
+    """Provide the server's list_tools() response, fetched once per transport.
+    
+    The registered tools don't change while the server runs, so discovery
+    tests share this response instead of each requesting it again.
+    
+    Returns:
+        Tuple of (ListToolsResult, transport_name)
+    """
+    session, transport = mcp_session
+    return await session.list_tools(), transport
+
+
 @pytest.fixture
 async def stdio_session() -> AsyncGenerator[ClientSession, None]:
     """Provide a STDIO-only MCP client session for specific tests.
@@ -344,12 +404,52 @@ def extract_text_content(result) -> Optional[str]:
     Returns:
         Text content if found, None otherwise
     """
-    from mcp import types
+    return next(
+        (content.text for content in result.content if isinstance(content, types.TextContent)),
+        None
+    )
+
+
+def parse_tool_json(result) -> Any:
+    """Parse the JSON text content of an MCP tool result.
+    
+    Args:
+        result: MCP CallToolResult
+        
+    Returns:
+        The decoded JSON value
+        
+    Raises:
+        AssertionError: If the result has no text content
+        json.JSONDecodeError: If the text content is not valid JSON
+    """
+    text = extract_text_content(result)
+    assert text is not None, f"Tool result has no text content: {result.content!r}"
+    return _json_loads(text)
+
+
+def parse_tool_json_items(result, strict: bool = True) -> List[Any]:
+    """Parse every JSON text item of an MCP tool result.
+    
+    Parallel tools return one TextContent item per call.
     
+    Args:
+        result: MCP CallToolResult
+        strict: Fail the test on an item that is not valid JSON, showing its
+            text. With strict=False such items are skipped.
+        
+    Returns:
+        The decoded JSON values, in content order
+    """
+    items = []
     for content in result.content:
         if isinstance(content, types.TextContent):
-            return content.text
-    return None
+            try:
+                items.append(_json_loads(content.text))
+            except json.JSONDecodeError:
+                if strict:
+                    pytest.fail(f"Tool result item is not valid JSON: {content.text!r}")
+    return items
 
 
 def extract_error_text(result) -> Optional[str]:
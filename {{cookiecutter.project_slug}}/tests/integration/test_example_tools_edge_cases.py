@@ -6,7 +6,7 @@ that are not covered by the main integration tests.
 
 import pytest
 from mcp import types
-from .conftest import extract_text_content, extract_error_text
+from .conftest import extract_text_content, extract_error_text, parse_tool_json
 
 
 pytestmark = pytest.mark.anyio
@@ -49,12 +49,9 @@ class TestToolEdgeCases:
         
         # Should handle n=0 case
         assert result.isError is False
-        for content in result.content:
-            if isinstance(content, types.TextContent):
-                import json
-                data = json.loads(content.text)
-                assert data["position"] == 0
-                assert data["value"] == 0
+        data = parse_tool_json(result)
+        assert data["position"] == 0
+        assert data["value"] == 0
     
     async def test_fibonacci_one_position(self, mcp_session):
         """Test fibonacci with n=1 (line 77 coverage)."""
@@ -66,12 +63,9 @@ class TestToolEdgeCases:
         
         # Should handle n=1 case
         assert result.isError is False
-        for content in result.content:
-            if isinstance(content, types.TextContent):
-                import json
-                data = json.loads(content.text)
-                assert data["position"] == 1
-                assert data["value"] == 1
+        data = parse_tool_json(result)
+        assert data["position"] == 1
+        assert data["value"] == 1
 
 {% if cookiecutter.include_parallel_example == "yes" %}    
     async def test_batch_data_unknown_operation(self, mcp_session):
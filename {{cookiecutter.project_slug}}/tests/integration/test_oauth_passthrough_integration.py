@@ -5,17 +5,40 @@ These tests verify that OAuth tokens can be passed through the MCP protocol
 from client to server and that the OAuth-protected tools work correctly.
 """
 
+import asyncio
 import json
 import os
 import pytest
 from datetime import timedelta
 from mcp import ClientSession, types
-from tests.integration.conftest import extract_text_content
+from tests.integration.conftest import extract_text_content, parse_tool_json
 
 # Mark all tests as async
 pytestmark = pytest.mark.anyio
 
 
+def make_tool_request(
+    name: str,
+    arguments: dict,
+    github_token: str,
+    correlation_id: str
+) -> types.ClientRequest:
+    """Build a tools/call request carrying a GitHub OAuth token in _meta."""
+    return types.ClientRequest(
+        types.CallToolRequest(
+            method="tools/call",
+            params=types.CallToolRequestParams(
+                name=name,
+                arguments=arguments,
+                _meta={
+                    "oauth_tokens": {"github": github_token},
+                    "correlationId": correlation_id
+                }
+            )
+        )
+    )
+
+
 class TestOAuthPassthroughIntegration:
     """Test OAuth passthrough with real MCP client/server communication."""
     
@@ -37,7 +60,7 @@ class TestOAuthPassthroughIntegration:
         
         # Parse the response
         try:
-            data = json.loads(text_content)
+            data = parse_tool_json(result)
             assert "error" in data, f"Expected error response, got: {data}"
             assert data["error"] == "token_not_provided", f"Wrong error type: {data}"
             assert "github" in data.get("message", "").lower(), f"Error message should mention github: {data}"
@@ -53,20 +76,8 @@ class TestOAuthPassthroughIntegration:
         session, transport = mcp_session
         
         # Build request with OAuth token in metadata
-        request = types.ClientRequest(
-            types.CallToolRequest(
-                method="tools/call",
-                params=types.CallToolRequestParams(
-                    name="get_github_user",
-                    arguments={},
-                    _meta={
-                        "oauth_tokens": {
-                            "github": "gho_mock_test_token_12345"
-                        },
-                        "correlationId": "test_oauth_001"
-                    }
-                )
-            )
+        request = make_tool_request(
+            "get_github_user", {}, "gho_mock_test_token_12345", "test_oauth_001"
         )
         
         # Send request with metadata
@@ -78,11 +89,10 @@ class TestOAuthPassthroughIntegration:
         # Should succeed at protocol level
         assert not result.isError, f"Protocol error: {result}"
         
-        text_content = extract_text_content(result)
-        assert text_content is not None
+        assert extract_text_content(result) is not None
         
         # Parse response
-        data = json.loads(text_content)
+        data = parse_tool_json(result)
         
         # Should get unauthorized error from GitHub API (401)
         assert "error" in data, f"Expected error from invalid token, got: {data}"
@@ -100,8 +110,7 @@ class TestOAuthPassthroughIntegration:
         
         assert not result.isError
         
-        text_content = extract_text_content(result)
-        data = json.loads(text_content)
+        data = parse_tool_json(result)
         
         assert data["error"] == "token_not_provided"
         assert "github" in data.get("message", "").lower()
@@ -119,12 +128,35 @@ class TestOAuthPassthroughIntegration:
         
         assert not result.isError
         
-        text_content = extract_text_content(result)
-        data = json.loads(text_content)
+        data = parse_tool_json(result)
         
         assert data["error"] == "token_not_provided"
         assert "github" in data.get("message", "").lower()
     
+    async def test_github_tools_called_concurrently(self, mcp_session):
+        """Test several OAuth tools called at once over one session.
+        
+        The calls are issued together, so the test takes as long as the
+        slowest call rather than the sum, and each response must still
+        match its own request.
+        """
+        session, transport = mcp_session
+        calls = (
+            ("get_github_user", {}),
+            ("list_user_repos", {"per_page": 10, "page": 1}),
+            ("create_github_issue", {"owner": "test", "repo": "test", "title": "Test Issue"})
+        )
+        
+        results = await asyncio.gather(
+            *(session.call_tool(name, arguments) for name, arguments in calls)
+        )
+        
+        for (name, _), result in zip(calls, results):
+            assert not result.isError, f"{name} failed at protocol level (transport: {transport})"
+            data = parse_tool_json(result)
+            assert data["error"] == "token_not_provided", f"{name} returned {data} (transport: {transport})"
+            assert data["provider"] == "github"
+    
     @pytest.mark.skipif(
         not os.environ.get("GITHUB_TOKEN"),
         reason="GITHUB_TOKEN environment variable not set"
@@ -138,20 +170,8 @@ class TestOAuthPassthroughIntegration:
         real_token = os.environ["GITHUB_TOKEN"]
         
         # Build request with real OAuth token
-        request = types.ClientRequest(
-            types.CallToolRequest(
-                method="tools/call",
-                params=types.CallToolRequestParams(
-                    name="get_github_user",
-                    arguments={},
-                    _meta={
-                        "oauth_tokens": {
-                            "github": real_token
-                        },
-                        "correlationId": "test_real_token"
-                    }
-                )
-            )
+        request = make_tool_request(
+            "get_github_user", {}, real_token, "test_real_token"
         )
         
         # Send request with metadata
@@ -162,8 +182,7 @@ class TestOAuthPassthroughIntegration:
         
         assert not result.isError
         
-        text_content = extract_text_content(result)
-        data = json.loads(text_content)
+        data = parse_tool_json(result)
         
         # Should get successful response with user data
         assert "error" not in data, f"Got error with real token: {data}"
@@ -17,19 +17,21 @@ Critical validations:
 import asyncio
 import inspect
 import json
+import logging
 import sqlite3
 import tempfile
 import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from unittest.mock import patch, MagicMock
 import pytest
 
 # Import decorators from template
 from {{cookiecutter.project_slug}}.decorators.exception_handler import exception_handler
-from {{cookiecutter.project_slug}}.decorators.tool_logger import tool_logger
+from {{cookiecutter.project_slug}}.decorators.tool_logger import tool_logger, _summarize_output, OUTPUT_SUMMARY_LIMIT
 from {{cookiecutter.project_slug}}.decorators.parallelize import parallelize
+from {{cookiecutter.project_slug}}.decorators.type_converter import type_converter
 from {{cookiecutter.project_slug}}.decorators.sqlite_logger import (
     SQLiteLoggerSink, 
     initialize_sqlite_logging,
@@ -63,7 +65,18 @@ class TestExceptionHandler:
         # The current implementation re-raises exceptions for MCP to handle
         with pytest.raises(ValueError, match="Test error message"):
             await failing_tool("test_input")
-    
+
+    @pytest.mark.asyncio
+    async def test_exception_with_braces_in_traceback(self):
+        """Test that braces in the traceback text don't break error logging."""
+
+        @exception_handler
+        async def failing_tool(param: str) -> str:
+            return {}["{missing}"]
+
+        with pytest.raises(KeyError, match="{missing}"):
+            await failing_tool("test_input")
+
     def test_signature_preservation(self):
         """Test that function signature is preserved for MCP introspection."""
         
@@ -149,6 +162,48 @@ class TestToolLogger:
         assert params == ["param1", "param2"]
         assert "kwargs" not in params
         assert sig.return_annotation == Dict[str, Any]
+    
+    @pytest.mark.asyncio
+    async def test_info_records_skipped_when_info_disabled(self):
+        """Test that only failures are logged when INFO records are dropped."""
+        
+        @tool_logger
+        async def test_tool(param: str) -> str:
+            if param == "fail":
+                raise RuntimeError("Test error")
+            return f"result_{param}"
+        
+        with patch('{{ cookiecutter.project_slug }}.decorators.tool_logger.UnifiedLogger._level_no', logging.WARNING), \
+                patch('{{ cookiecutter.project_slug }}.decorators.tool_logger.UnifiedLogger.get_logger') as mock_get_logger:
+            assert await test_tool(param="ok") == "result_ok"
+            with pytest.raises(RuntimeError):
+                await test_tool(param="fail")
+        
+        mock_logger = mock_get_logger.return_value
+        mock_logger.info.assert_not_called()
+        mock_logger.error.assert_called_once()
+        assert mock_logger.error.call_args.kwargs["input_args"] == {"param": "fail"}
+    
+    @pytest.mark.asyncio
+    async def test_sync_tool_logging(self):
+        """Test that a sync tool is called directly rather than awaited."""
+        
+        @tool_logger
+        def sync_tool(param: str) -> str:
+            return f"result_{param}"
+        
+        result = await sync_tool(param="test_input")
+        
+        assert result == "result_test_input"
+    
+    def test_output_summary_truncation(self):
+        """Test that output summaries match str() and stop at the limit."""
+        result = {"items": list(range(10000)), "name": "x" * 1000}
+        
+        summary = _summarize_output(result)
+        
+        assert summary == str(result)[:OUTPUT_SUMMARY_LIMIT] + "..."
+        assert _summarize_output({"b": 1, "a": 2}) == "{'b': 1, 'a': 2}"
 
 
 class TestParallelize:
@@ -218,6 +273,12 @@ class TestParallelize:
         # Test invalid list item type
         with pytest.raises(TypeError, match="Item 0 in kwargs_list must be a dict"):
             await test_tool(["not_a_dict"])
+        
+        # Test item arguments that don't match the signature
+        with pytest.raises(TypeError, match="missing a required argument: 'param'"):
+            await test_tool([{"param": "a"}, {}])
+        with pytest.raises(TypeError, match="unexpected keyword argument 'other'"):
+            await test_tool([{"param": "a", "other": 1}])
     
     @pytest.mark.asyncio
     async def test_fail_fast_behavior(self):
@@ -239,6 +300,27 @@ class TestParallelize:
         with pytest.raises(ValueError, match="Failure for b"):
             await test_tool(kwargs_list)
     
+    @pytest.mark.asyncio
+    async def test_fail_fast_cancels_remaining_items(self):
+        """Test that the first failure cancels items still running."""
+        cancelled = []
+        
+        @parallelize
+        async def test_tool(param: str, should_fail: bool = False) -> str:
+            if should_fail:
+                raise ValueError(f"Failure for {param}")
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(param)
+                raise
+            return f"success_{param}"
+        
+        with pytest.raises(ValueError, match="Failure for b"):
+            await test_tool([{"param": "a"}, {"param": "b", "should_fail": True}])
+        
+        assert cancelled == ["a"]
+    
     def test_docstring_generation(self):
         """Test that docstring is correctly generated for parallelized function."""
         
@@ -254,6 +336,38 @@ class TestParallelize:
         assert "Original docstring for test tool." in docstring
 
 
+class TestTypeConverter:
+    """Test runtime conversion of string parameters."""
+    
+    @pytest.mark.asyncio
+    async def test_string_parameter_conversion(self):
+        """Test str values are converted to the annotated scalar types."""
+        
+        @type_converter
+        async def test_tool(count: int, ratio: float, flag: bool, name: str, items: list) -> Dict[str, Any]:
+            return {"count": count, "ratio": ratio, "flag": flag, "name": name, "items": items}
+        
+        result = await test_tool(count="3", ratio="0.5", flag="false", name="x", items='["a", "b"]')
+        assert result == {"count": 3, "ratio": 0.5, "flag": False, "name": "x", "items": ["a", "b"]}
+        
+        # Unconvertible values are passed through unchanged
+        result = await test_tool(count="three", ratio="0.5", flag="maybe", name="x", items="a")
+        assert result["count"] == "three"
+        assert result["flag"] == "maybe"
+        assert result["items"] == ["a"]
+    
+    @pytest.mark.asyncio
+    async def test_optional_and_default_parameters(self):
+        """Test Optional[X] converts to X and omitted parameters get defaults."""
+        
+        @type_converter
+        async def test_tool(limit: Optional[int] = None, page: int = 1) -> Dict[str, Any]:
+            return {"limit": limit, "page": page}
+        
+        assert await test_tool(limit="5") == {"limit": 5, "page": 1}
+        assert await test_tool() == {"limit": None, "page": 1}
+
+
 class TestDecoratorChaining:
     """Test that decorators can be chained correctly."""
     
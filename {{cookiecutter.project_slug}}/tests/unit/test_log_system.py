@@ -0,0 +1,343 @@
+"""Tests for the unified logging system.
+
+This test suite validates the log destination layer and the Loguru sink:
+- LogDestinationFactory sharing SQLite destinations per data directory
+- Batched SQLite writes committing once per batch and skipping bad entries
+- MultiDestination isolating failing destinations
+- UnifiedLogger buffering sink entries into batches
+- Batches handed to the app loop or the shared background loop
+- Bounded waits and shutdown of the background loop
+- Level checks following the configured log level
+"""
+
+import asyncio
+import logging
+import sqlite3
+import sys
+import threading
+from datetime import datetime
+from typing import List
+
+import pytest
+from loguru import logger
+
+from {{cookiecutter.project_slug}}.config import ServerConfig
+from {{cookiecutter.project_slug}}.log_system.destinations import (
+    DestinationConfig,
+    LogDestination,
+    LogDestinationFactory,
+    LogEntry,
+    MultiDestination,
+    SQLiteDestination,
+)
+from {{cookiecutter.project_slug}}.log_system import unified_logger as unified_logger_module
+from {{cookiecutter.project_slug}}.log_system.unified_logger import UnifiedLogger
+
+
+@pytest.fixture
+def server_config(tmp_path):
+    """Create a server config whose directories live in a temp dir."""
+    return ServerConfig(config_dir=tmp_path, data_dir=tmp_path, log_dir=tmp_path)
+
+
+def make_entry(message: str = "test message") -> LogEntry:
+    """Create a minimal internal log entry."""
+    return LogEntry(
+        correlation_id="test_correlation",
+        timestamp=datetime.now(),
+        level="INFO",
+        log_type="internal",
+        message=message,
+    )
+
+
+def count_rows(config: ServerConfig) -> int:
+    """Count the rows in the unified log table."""
+    conn = sqlite3.connect(str(config.data_dir / "unified_logs.db"))
+    try:
+        return conn.execute("SELECT COUNT(*) FROM unified_logs").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class RecordingDestination(LogDestination):
+    """Destination that keeps written entries in memory."""
+
+    def __init__(self):
+        self.entries: List[LogEntry] = []
+
+    async def write(self, entry: LogEntry) -> None:
+        self.entries.append(entry)
+
+    async def query(self, **filters) -> List[LogEntry]:
+        return list(self.entries)
+
+    async def close(self) -> None:
+        pass
+
+
+class FailingDestination(RecordingDestination):
+    """Destination whose writes always fail."""
+
+    async def write(self, entry: LogEntry) -> None:
+        raise RuntimeError("destination unavailable")
+
+
+class BatchRecordingDestination(RecordingDestination):
+    """Sync destination that records the size of every batch it receives."""
+
+    def __init__(self):
+        super().__init__()
+        self.batch_sizes: List[int] = []
+
+    def write_many_sync(self, entries: List[LogEntry]) -> None:
+        self.batch_sizes.append(len(entries))
+        self.entries.extend(entries)
+
+
+class LoopRecordingDestination(RecordingDestination):
+    """Async destination that records the loop and thread each batch ran on."""
+
+    def __init__(self):
+        super().__init__()
+        self.loops = []
+        self.threads = []
+
+    async def write_many(self, entries: List[LogEntry]) -> None:
+        self.loops.append(asyncio.get_running_loop())
+        self.threads.append(threading.current_thread().name)
+        self.entries.extend(entries)
+
+
+class HangingDestination(RecordingDestination):
+    """Async destination whose batch writes never finish."""
+
+    async def write_many(self, entries: List[LogEntry]) -> None:
+        await asyncio.Event().wait()
+
+
+@pytest.fixture
+def unified_logger():
+    """Give UnifiedLogger to a test and close it afterwards."""
+    yield UnifiedLogger
+    if UnifiedLogger._initialized:
+        # A failed test may leave the logger open; close it on a fresh loop
+        asyncio.run(UnifiedLogger.close())
+    # Restore Loguru's default handler for the tests that follow
+    logger.remove()
+    logger.add(sys.stderr)
+
+
+class TestLogDestinationFactory:
+    """Test LogDestinationFactory destination creation."""
+
+    def test_sqlite_destination_shared_per_data_dir(self, server_config, tmp_path):
+        """Test that the same data_dir yields the same SQLite destination."""
+        first = LogDestinationFactory.create_destination(DestinationConfig(type="sqlite"), server_config)
+        second = LogDestinationFactory.create_destination(DestinationConfig(type="sqlite"), server_config)
+
+        assert first is second
+
+        other_dir = tmp_path / "other"
+        other_config = ServerConfig(config_dir=other_dir, data_dir=other_dir, log_dir=other_dir)
+        other = LogDestinationFactory.create_destination(DestinationConfig(type="sqlite"), other_config)
+        assert other is not first
+
+    @pytest.mark.asyncio
+    async def test_closing_shared_destination_keeps_it_usable(self, server_config):
+        """Test that closing one handle doesn't break the other holder."""
+        first = LogDestinationFactory.create_destination(DestinationConfig(type="sqlite"), server_config)
+        second = LogDestinationFactory.create_destination(DestinationConfig(type="sqlite"), server_config)
+
+        await first.write(make_entry("before close"))
+        await first.close()
+
+        # The closed thread-local connection is reopened on next use
+        await second.write(make_entry("after close"))
+        entries = await second.query()
+
+        assert {entry.message for entry in entries} == {"before close", "after close"}
+        assert count_rows(server_config) == 2
+
+
+class TestSQLiteDestination:
+    """Test SQLiteDestination batched writes."""
+
+    def test_write_many_sync_uses_one_transaction(self, server_config):
+        """Test that a batch of N entries inserts N rows with a single commit."""
+        destination = SQLiteDestination(server_config)
+        statements = []
+        destination._get_connection().set_trace_callback(statements.append)
+
+        destination.write_many_sync([make_entry(f"entry {i}") for i in range(25)])
+
+        assert count_rows(server_config) == 25
+        assert sum(s.startswith("BEGIN") for s in statements) == 1
+        assert statements.count("COMMIT") == 1
+
+    def test_write_many_sync_skips_invalid_entries(self, server_config):
+        """Test that one invalid entry is skipped and the rest are written."""
+        destination = SQLiteDestination(server_config)
+        invalid = make_entry("invalid")
+        invalid.log_type = "not_a_log_type"
+
+        with pytest.raises(ValueError, match="Skipped 1 of 3"):
+            destination.write_many_sync([make_entry("first"), invalid, make_entry("second")])
+
+        assert count_rows(server_config) == 2
+
+    @pytest.mark.asyncio
+    async def test_json_columns_accept_values_orjson_rejects(self, server_config):
+        """Test that big ints and arbitrary objects are still serialized."""
+        destination = SQLiteDestination(server_config)
+        entry = make_entry("odd values")
+        entry.input_args = {"big": 2**70}
+        entry.extra_data = {"obj": object()}
+
+        destination.write_many_sync([entry])
+
+        [stored] = await destination.query()
+        assert stored.input_args == {"big": 2**70}
+        assert stored.extra_data["obj"].startswith("<object object at")
+
+
+class TestMultiDestination:
+    """Test MultiDestination fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_write_continues_past_failing_destination(self):
+        """Test that a failing destination doesn't stop writes to the others."""
+        first, second = RecordingDestination(), RecordingDestination()
+        multi = MultiDestination([first, FailingDestination(), second])
+
+        await multi.write(make_entry("single"))
+        await multi.write_many([make_entry("batch 1"), make_entry("batch 2")])
+
+        for destination in (first, second):
+            assert [entry.message for entry in destination.entries] == ["single", "batch 1", "batch 2"]
+
+
+class TestUnifiedLogger:
+    """Test the UnifiedLogger sink."""
+
+    @pytest.mark.asyncio
+    async def test_sink_writes_entries_in_batches(self, unified_logger):
+        """Test that logged messages reach the destination in batches."""
+        destination = BatchRecordingDestination()
+        unified_logger.initialize(destination)
+
+        log = unified_logger.get_logger("test")
+        for i in range(250):
+            log.info(f"message {i}")
+        await unified_logger.close()
+
+        messages = [entry.message for entry in destination.entries]
+        assert messages == [f"message {i}" for i in range(250)]
+        assert len(destination.batch_sizes) < 250
+        assert max(destination.batch_sizes) <= 100
+
+    @pytest.mark.asyncio
+    async def test_batches_handed_to_running_app_loop(self, unified_logger):
+        """Test that async destinations are written on the app loop when it runs."""
+        destination = LoopRecordingDestination()
+        unified_logger.initialize(destination, asyncio.get_running_loop())
+
+        unified_logger.get_logger("test").info("on app loop")
+        await unified_logger.close()
+
+        assert [entry.message for entry in destination.entries] == ["on app loop"]
+        assert destination.loops == [asyncio.get_running_loop()]
+
+    def test_batches_use_background_loop_without_app_loop(self, unified_logger):
+        """Test that async destinations use the background loop from sync code."""
+        destination = LoopRecordingDestination()
+        unified_logger.initialize(destination)
+
+        unified_logger.get_logger("test").info("from sync code")
+        asyncio.run(unified_logger.close())
+
+        assert [entry.message for entry in destination.entries] == ["from sync code"]
+        assert destination.threads == ["unified-logger-loop"]
+        assert unified_logger_module._LOOP_THREAD is None
+        assert destination.loops[0].is_closed()
+
+    def test_hung_write_times_out_with_warning(self, unified_logger, monkeypatch, capsys):
+        """Test that a destination that never answers is abandoned with a warning."""
+        monkeypatch.setattr(unified_logger_module, "_WRITE_TIMEOUT", 0.1)
+        unified_logger.initialize(HangingDestination())
+
+        unified_logger.get_logger("test").info("never written")
+        asyncio.run(unified_logger.close())
+
+        assert "Timed out after 0.1s writing 1 log entries" in capsys.readouterr().err
+
+    def test_shutdown_drains_and_stops_background_loop(self, unified_logger, monkeypatch):
+        """Test that the exit hook flushes buffered entries, then stops the loop."""
+        monkeypatch.setattr(unified_logger_module, "_shutting_down", False)
+        destination = LoopRecordingDestination()
+        unified_logger.initialize(destination)
+
+        # Start the background loop before exit, as an earlier batch would
+        unified_logger_module.run_coro(asyncio.sleep(0))
+
+        unified_logger.get_logger("test").info("flushed at exit")
+        unified_logger_module._shutdown()
+
+        assert [entry.message for entry in destination.entries] == ["flushed at exit"]
+        assert unified_logger_module._LOOP_THREAD is None
+        assert destination.loops[0].is_closed()
+
+    def test_shutdown_doesnt_start_background_loop(self, unified_logger, monkeypatch, capsys):
+        """Test that the exit hook reports, rather than starts a loop for, pending async writes."""
+        monkeypatch.setattr(unified_logger_module, "_shutting_down", False)
+        destination = LoopRecordingDestination()
+        unified_logger.initialize(destination)
+
+        unified_logger.get_logger("test").info("pending at exit")
+        unified_logger_module._shutdown()
+
+        assert destination.entries == []
+        assert unified_logger_module._LOOP_THREAD is None
+        assert "during interpreter shutdown" in capsys.readouterr().err
+
+    def test_loop_stop_cancels_unfinished_tasks(self):
+        """Test that stopping the background loop cancels tasks that outlive the drain."""
+        loop_thread = unified_logger_module._LoopThread()
+        future = asyncio.run_coroutine_threadsafe(asyncio.Event().wait(), loop_thread.loop)
+
+        loop_thread.stop(0.1)
+
+        assert future.cancelled()
+        assert loop_thread.loop.is_closed()
+
+    def test_record_with_arbitrary_extra_data_is_written(self, unified_logger, server_config, capsys):
+        """Test that a record bound to an arbitrary object is written with the others."""
+        unified_logger.initialize(SQLiteDestination(server_config))
+
+        log = unified_logger.get_logger("test")
+        for i in range(10):
+            log.info(f"message {i}")
+        log.bind(obj=object()).info("unserializable")
+        for i in range(10, 20):
+            log.info(f"message {i}")
+        asyncio.run(unified_logger.close())
+
+        assert count_rows(server_config) == 21
+        assert "Could not write log entries" not in capsys.readouterr().err
+
+    def test_is_enabled_for_follows_configured_level(self, unified_logger, server_config):
+        """Test that level checks and the sink follow the configured log_level."""
+        unified_logger.initialize(RecordingDestination())
+        assert unified_logger.is_enabled_for(logging.INFO)
+
+        server_config.log_level = "WARNING"
+        unified_logger.initialize_default(server_config)
+        assert not unified_logger.is_enabled_for(logging.INFO)
+        assert unified_logger.is_enabled_for(logging.ERROR)
+
+        log = unified_logger.get_logger("test")
+        log.info("below level")
+        log.warning("at level")
+        asyncio.run(unified_logger.close())
+
+        assert count_rows(server_config) == 1
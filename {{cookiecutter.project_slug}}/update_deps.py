@@ -5,55 +5,66 @@ Script to extract package names from requirements.txt and update BUILD.bazel dep
 import re
 from pathlib import Path
 
+# Package name at the start of a pinned requirement line, ignoring any extras
+# (e.g. "mcp[cli]==1.0.0" -> "mcp"). Comments and blank lines never match.
+_PKG_RE = re.compile(r'^[ \t]*([A-Za-z0-9_.\-]+?)(?:\[[^\]]*\])?[ \t]*==', re.MULTILINE)
+# Convert hyphens to underscores for Python imports
+_HYPHEN_TO_UNDERSCORE = str.maketrans('-', '_')
+
+# py_library target and external pip repository used by this project's BUILD.bazel
+LIB_TARGET = "{{ cookiecutter.project_slug }}_lib"
+DEPS_REPO = "@mcp_{{ cookiecutter.project_slug }}"
+
 def extract_package_names(requirements_file):
     """Extract package names from requirements.txt file"""
-    package_names = []
+    text = Path(requirements_file).read_text(encoding='utf-8')
     
-    with open(requirements_file, 'r') as f:
-        for line in f:
-            line = line.strip()
-            # Skip comments and empty lines
-            if line.startswith('#') or not line:
-                continue
-            
-            # Look for lines with package==version format
-            if '==' in line:
-                # Extract package name (everything before ==)
-                package_name = line.split('==')[0].strip()
-                # Convert hyphens to underscores for Python imports
-                package_name = package_name.replace('-', '_')
-                package_names.append(package_name)
+    # Scan the whole file for lines with package==version format
+    package_names = {
+        match.group(1).translate(_HYPHEN_TO_UNDERSCORE)
+        for match in _PKG_RE.finditer(text)
+    }
     
-    # Remove duplicates and sort
-    return sorted(list(set(package_names)))
+    return sorted(package_names)
 
-def update_build_bazel(build_file, package_names):
-    """Update BUILD.bazel file with the extracted dependencies"""
+def update_build_bazel(build_file, package_names, target=LIB_TARGET, repo=DEPS_REPO):
+    """Update BUILD.bazel file with the extracted dependencies
+    
+    Rewrites the deps list of the given py_library target, pointing each
+    package at the given external repository.
+    
+    Returns True if the file was rewritten, False if it was already up to date,
+    so unchanged files keep their mtime. Raises ValueError if the file has no
+    such target with a deps list to update.
+    """
     
     # Read the current BUILD.bazel file
     with open(build_file, 'r') as f:
         content = f.read()
     
     # Generate the new dependencies list
-    deps_lines = []
-    for pkg in package_names:
-        deps_lines.append(f'        "@mcp_semrush_mcp//{pkg}",')
+    deps_content = '\n'.join(f'        "{repo}//{pkg}",' for pkg in package_names)
     
-    deps_content = '\n'.join(deps_lines)
+    # Locate the deps list of the py_library and splice the new list in
+    lib_start = content.find(f'name = "{target}"')
+    if lib_start == -1:
+        raise ValueError(f'{build_file} has no "{target}" target')
+    deps_start = content.find('deps = [', lib_start)
+    if deps_start == -1:
+        raise ValueError(f'{build_file} has no deps list in the "{target}" target')
+    deps_start += len('deps = [')
+    deps_end = content.find('\n    ],', deps_start)
+    if deps_end == -1:
+        raise ValueError(f'{build_file} has an unterminated deps list in the "{target}" target')
     
-    # Find and replace the deps section in py_library
-    pattern = r'(py_library\(\s*\n\s*name = "semrush_mcp_lib",.*?\n\s*deps = \[)(.*?)(\n\s*\],\s*\n\))'
-    
-    def replace_deps(match):
-        prefix = match.group(1)
-        suffix = match.group(3)
-        return f"{prefix}\n{deps_content}{suffix}"
-    
-    new_content = re.sub(pattern, replace_deps, content, flags=re.DOTALL)
+    new_content = f"{content[:deps_start]}\n{deps_content}{content[deps_end:]}"
+    if new_content == content:
+        return False
     
     # Write the updated content back
     with open(build_file, 'w') as f:
         f.write(new_content)
+    return True
 
 def main():
     script_dir = Path(__file__).parent
@@ -76,9 +87,15 @@ def main():
         print(f"  - {pkg}")
     
     print("\nUpdating BUILD.bazel...")
-    update_build_bazel(build_file, package_names)
-    
-    print("BUILD.bazel updated successfully!")
+    try:
+        updated = update_build_bazel(build_file, package_names)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
+    if updated:
+        print("BUILD.bazel updated successfully!")
+    else:
+        print("BUILD.bazel up to date")
 
 if __name__ == '__main__':
     main() 
\ No newline at end of file
@@ -41,10 +41,11 @@ def oauth_passthrough(provider: str):
         Returns:
             Wrapped function that checks for tokens
         """
+        # Look the logger up once per decorated tool, not on every call
+        logger = logging.getLogger(f'{{ cookiecutter.project_slug }}.oauth.{provider}')
+        
         @wraps(func)
         async def wrapper(*args, **kwargs) -> Any:
-            logger = logging.getLogger(f'{{ cookiecutter.project_slug }}.oauth.{provider}')
-            
             try:
                 # Get Context from kwargs (following SAAGA pattern)
                 ctx = kwargs.get("ctx")
@@ -64,7 +65,7 @@ def oauth_passthrough(provider: str):
                         
                         # Basic token validation (non-empty)
                         if not token or not isinstance(token, str) or not token.strip():
-                            logger.warning(f"Invalid {provider} token format provided")
+                            logger.warning("Invalid %s token format provided", provider)
                             return {
                                 "error": "invalid_token_format",
                                 "message": f"Invalid {provider} token format",
@@ -96,10 +97,10 @@ def oauth_passthrough(provider: str):
                         return result
                     
                     # No token for this provider
-                    logger.info(f"No {provider} token provided in context")
+                    logger.info("No %s token provided in context", provider)
                     
                 else:
-                    logger.debug(f"Context structure not suitable for OAuth extraction")
+                    logger.debug("Context structure not suitable for OAuth extraction")
                 
                 # No token provided - return graceful error
                 # NO auth URLs, NO OAuth flow instructions
@@ -112,7 +113,7 @@ def oauth_passthrough(provider: str):
                 
             except Exception as e:
                 # Catch any unexpected errors to prevent crashes
-                logger.error(f"Unexpected error in oauth_passthrough for {provider}: {str(e)}")
+                logger.error("Unexpected error in oauth_passthrough for %s: %s", provider, e)
                 return {
                     "error": "oauth_processing_error",
                     "message": f"Error processing OAuth token for {provider}",
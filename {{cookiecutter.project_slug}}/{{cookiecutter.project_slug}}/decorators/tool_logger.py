@@ -28,11 +28,91 @@ from typing import Callable, Any, Awaitable
 import time
 import json
 import inspect
+import logging
+import reprlib
+from itertools import islice
 
 from {{ cookiecutter.project_slug }}.log_system.correlation import set_correlation_id, get_correlation_id, clear_correlation_id, generate_correlation_id
 from {{ cookiecutter.project_slug }}.log_system.unified_logger import UnifiedLogger
 from mcp.server.fastmcp import Context
 
+# Longest output summary stored with a tool execution log
+OUTPUT_SUMMARY_LIMIT = 200
+
+
+class _SummaryRepr(reprlib.Repr):
+    """Bounded repr for output summaries.
+    
+    Renders containers the way str() does, but stops once the summary limit
+    is reached, so a huge tool result is never fully formatted.
+    """
+    
+    def __init__(self, limit: int):
+        super().__init__()
+        # Every rendered element takes at least one character, so no more
+        # than `limit` elements (or characters of a scalar) can be visible
+        self.maxdict = self.maxlist = self.maxtuple = limit
+        self.maxset = self.maxfrozenset = self.maxdeque = self.maxarray = limit
+        self.maxstring = self.maxlong = self.maxother = limit
+    
+    def repr_str(self, x: str, level: int) -> str:
+        # Keep the leading characters (reprlib elides the middle by default)
+        return repr(x[:self.maxstring + 1])
+    
+    repr_bytes = repr_str
+    
+    def repr_dict(self, x: dict, level: int) -> str:
+        # Keep insertion order (reprlib sorts keys by default)
+        if not x:
+            return '{}'
+        if level <= 0:
+            return '{...}'
+        pieces = [f"{self.repr1(k, level - 1)}: {self.repr1(v, level - 1)}"
+                  for k, v in islice(x.items(), self.maxdict)]
+        if len(x) > self.maxdict:
+            pieces.append('...')
+        return '{' + ', '.join(pieces) + '}'
+
+
+_summary_repr = _SummaryRepr(OUTPUT_SUMMARY_LIMIT)
+
+# Result types summarized with reprlib. Exact types are matched by identity
+# first; isinstance only runs for subclasses and everything else.
+_CONTAINER_TYPES = (dict, list, tuple, set, frozenset, bytes)
+_EXACT_CONTAINER_TYPES = frozenset(_CONTAINER_TYPES)
+
+
+def _summarize_output(result: Any) -> str:
+    """Summarize a tool result for logging, truncated to OUTPUT_SUMMARY_LIMIT."""
+    result_type = type(result)
+    if result_type is str:
+        text = result
+    elif result_type in _EXACT_CONTAINER_TYPES:
+        text = _summary_repr.repr(result)
+    elif isinstance(result, str):
+        text = result
+    elif isinstance(result, _CONTAINER_TYPES):
+        text = _summary_repr.repr(result)
+    else:
+        text = str(result)
+    if len(text) > OUTPUT_SUMMARY_LIMIT:
+        return text[:OUTPUT_SUMMARY_LIMIT] + "..."
+    return text
+
+
+def _loggable_args(kwargs: dict) -> dict:
+    """Select the tool arguments to store with a tool execution log."""
+    # MCP passes parameters directly as keyword arguments, so there are no
+    # positional args. Filter out ctx and Context objects - they contain
+    # unpicklable asyncio objects
+    try:
+        input_args = {k: v for k, v in kwargs.items()
+                      if k != 'ctx' and not isinstance(v, Context)}
+        json.dumps(input_args, default=str)
+        return input_args
+    except Exception:
+        return {}
+
 
 def tool_logger(func: Callable[..., Awaitable[Any]] = None, config: dict = None) -> Callable[..., Awaitable[Any]]:
     """Enhanced tool logger with configuration - SAAGA Pattern.
@@ -47,6 +127,13 @@ def tool_logger(func: Callable[..., Awaitable[Any]] = None, config: dict = None)
     Or with config:
         decorated = tool_logger(my_tool, config)
     
+    When the configured log_level keeps INFO records out of the unified
+    sink (see UnifiedLogger.is_enabled_for), the start and completion records, the
+    output summary and the input args they carry are skipped entirely; only
+    failures are logged. The admin UI's tool statistics and success-rate
+    figures are computed from these records, so they then only reflect
+    failed executions.
+    
     Args:
         func: The async function to decorate
         config: Optional configuration dictionary
@@ -56,6 +143,10 @@ def tool_logger(func: Callable[..., Awaitable[Any]] = None, config: dict = None)
     """
     
     def decorator(f: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        # type_converter hands sync tools through as sync wrappers. The wrapper
+        # stays async for the rest of the chain, but only awaits coroutines.
+        is_async = asyncio.iscoroutinefunction(f)
+        
         @wraps(f)
         async def wrapper(*args, **kwargs) -> Any:
             # Check if MCP client provided a correlation ID via context metadata
@@ -97,53 +188,55 @@ def tool_logger(func: Callable[..., Awaitable[Any]] = None, config: dict = None)
             # Get correlation-aware logger
             logger = UnifiedLogger.get_logger(f"tool.{f.__name__}")
             
-            start_time = time.time()
+            # Monotonic integer clock: immune to wall-clock adjustments
+            start_ns = time.perf_counter_ns()
             tool_name = f.__name__
             
-            # Prepare input args for logging
-            # MCP passes parameters directly as keyword arguments
-            try:
-                # For MCP tools, we only have kwargs (no positional args)
-                # Filter out ctx and Context objects - they contain unpicklable asyncio objects
-                input_args_dict = {k: v for k, v in kwargs.items() 
-                                   if k != 'ctx' and not isinstance(v, Context)} if kwargs else {}
-                input_args_str = json.dumps(input_args_dict, default=str)
-            except Exception:
-                input_args_dict = {}
-                input_args_str = f"<{len(kwargs)} parameters>"
+            # Follow the level the unified sink actually accepts right now, so
+            # the INFO start/completion records are only built when kept
+            info_enabled = UnifiedLogger.is_enabled_for(logging.INFO)
             
-            logger.info(
-                f"Starting tool: {tool_name}",
-                log_type="tool_execution",
-                tool_name=tool_name,
-                status="running",
-                input_args=input_args_dict
-            )
+            # Input args are only needed up front for the INFO records; the
+            # failure path builds them itself when INFO is disabled
+            input_args_dict = _loggable_args(kwargs) if info_enabled else None
             
-            try:
-                result = await f(*args, **kwargs)
-                duration_ms = (time.time() - start_time) * 1000
-                
-                # Prepare output summary
-                try:
-                    output_summary = str(result)[:200] + "..." if len(str(result)) > 200 else str(result)
-                except Exception:
-                    output_summary = f"<{type(result).__name__}>"
-                
+            if info_enabled:
                 logger.info(
-                    f"Tool completed: {tool_name}",
+                    f"Starting tool: {tool_name}",
                     log_type="tool_execution",
                     tool_name=tool_name,
-                    duration_ms=duration_ms,
-                    status="success",
-                    input_args=input_args_dict,
-                    output_summary=output_summary
+                    status="running",
+                    input_args=input_args_dict
                 )
+            
+            try:
+                result = await f(*args, **kwargs) if is_async else f(*args, **kwargs)
+                
+                if info_enabled:
+                    duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+                    
+                    # Prepare output summary
+                    try:
+                        output_summary = _summarize_output(result)
+                    except Exception:
+                        output_summary = f"<{type(result).__name__}>"
+                    
+                    logger.info(
+                        f"Tool completed: {tool_name}",
+                        log_type="tool_execution",
+                        tool_name=tool_name,
+                        duration_ms=duration_ms,
+                        status="success",
+                        input_args=input_args_dict,
+                        output_summary=output_summary
+                    )
                 
                 return result
                 
             except Exception as e:
-                duration_ms = (time.time() - start_time) * 1000
+                duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+                if input_args_dict is None:
+                    input_args_dict = _loggable_args(kwargs)
                 
                 logger.error(
                     f"Tool failed: {tool_name}",
@@ -17,7 +17,7 @@ unchanged to maintain MCP compatibility.
 import inspect
 import json
 from functools import wraps
-from typing import Any, Callable, Dict, List, Optional, Union, get_args, get_origin
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, get_args, get_origin
 import asyncio
 
 
@@ -42,16 +42,18 @@ def type_converter(func: Callable) -> Callable:
         The decorated function with type conversion applied
     """
     sig = inspect.signature(func)
+    # Resolve annotations and defaults once instead of on every call
+    plan = _build_conversion_plan(sig)
     
     @wraps(func)
     async def async_wrapper(*args, **kwargs):
         """Async wrapper that performs type conversion."""
-        return await _convert_and_call(func, sig, args, kwargs, is_async=True)
+        return await _convert_and_call(func, plan, args, kwargs, is_async=True)
     
     @wraps(func)
     def sync_wrapper(*args, **kwargs):
         """Sync wrapper that performs type conversion."""
-        return _convert_and_call(func, sig, args, kwargs, is_async=False)
+        return _convert_and_call(func, plan, args, kwargs, is_async=False)
     
     # Return appropriate wrapper based on function type
     if asyncio.iscoroutinefunction(func):
@@ -65,43 +67,25 @@ def type_converter(func: Callable) -> Callable:
         return sync_wrapper
 
 
-def _convert_and_call(func: Callable, sig: inspect.Signature, args: tuple, kwargs: dict, is_async: bool) -> Any:
-    """Convert parameters and call the function.
+def _build_conversion_plan(sig: inspect.Signature) -> List[Tuple[str, Any, Any, Optional[type]]]:
+    """Resolve the conversion target of every parameter.
     
     Args:
-        func: The original function
         sig: The function signature
-        args: Positional arguments
-        kwargs: Keyword arguments
-        is_async: Whether the function is async
         
     Returns:
-        The function result
+        (name, default, annotation, origin) tuples in parameter order.
+        Optional[X] is unwrapped to X, and annotation is None for
+        unannotated parameters.
     """
-    # Convert kwargs based on function signature
-    converted_kwargs = {}
+    plan = []
     
     for param_name, param in sig.parameters.items():
-        # Skip if parameter not provided
-        if param_name not in kwargs:
-            # Use default if available
-            if param.default != inspect.Parameter.empty:
-                converted_kwargs[param_name] = param.default
-            continue
-        
-        value = kwargs[param_name]
-        
-        # Skip if already None (for Optional types)
-        if value is None:
-            converted_kwargs[param_name] = None
-            continue
-        
-        # Get the annotation for type conversion
         annotation = param.annotation
         
-        # Skip if no annotation
-        if annotation == inspect.Parameter.empty:
-            converted_kwargs[param_name] = value
+        # Unannotated parameters are passed through as-is
+        if annotation is inspect.Parameter.empty:
+            plan.append((param_name, param.default, None, None))
             continue
         
         # Handle Optional types
@@ -115,6 +99,42 @@ def _convert_and_call(func: Callable, sig: inspect.Signature, args: tuple, kwarg
                 annotation = non_none_types[0]
                 origin = get_origin(annotation)
         
+        plan.append((param_name, param.default, annotation, origin))
+    
+    return plan
+
+
+def _convert_and_call(func: Callable, plan: List[Tuple[str, Any, Any, Optional[type]]], args: tuple, kwargs: dict, is_async: bool) -> Any:
+    """Convert parameters and call the function.
+    
+    Args:
+        func: The original function
+        plan: Conversion plan from _build_conversion_plan
+        args: Positional arguments
+        kwargs: Keyword arguments
+        is_async: Whether the function is async
+        
+    Returns:
+        The function result
+    """
+    # Convert kwargs based on the precomputed plan
+    converted_kwargs = {}
+    
+    for param_name, default, annotation, origin in plan:
+        # Skip if parameter not provided
+        if param_name not in kwargs:
+            # Use default if available
+            if default is not inspect.Parameter.empty:
+                converted_kwargs[param_name] = default
+            continue
+        
+        value = kwargs[param_name]
+        
+        # Pass through None (for Optional types) and unannotated values
+        if value is None or annotation is None:
+            converted_kwargs[param_name] = value
+            continue
+        
         # Perform type conversion
         try:
             converted_value = _convert_value(value, annotation, origin)
@@ -148,20 +168,13 @@ def _convert_value(value: Any, target_type: type, origin: Optional[type]) -> Any
     
     # Handle string conversions
     if isinstance(value, str):
-        # Convert to int
-        if target_type == int:
-            return int(value)
-        
-        # Convert to float
-        elif target_type == float:
-            return float(value)
-        
-        # Convert to bool
-        elif target_type == bool:
-            return _str_to_bool(value)
+        # Convert to int, float or bool with a single table lookup
+        converter = _STR_CONVERTERS.get(target_type)
+        if converter is not None:
+            return converter(value)
         
         # Convert to List
-        elif origin is list or target_type == list:
+        if origin is list or target_type == list:
             if value.startswith('[') and value.endswith(']'):
                 return json.loads(value)
             else:
@@ -209,4 +222,12 @@ def _str_to_bool(value: str) -> bool:
     elif value.lower() in ('false', '0', 'no', 'off'):
         return False
     else:
-        raise ValueError(f"Cannot convert '{value}' to bool")
\ No newline at end of file
+        raise ValueError(f"Cannot convert '{value}' to bool")
+
+
+# Scalar conversions from str, keyed by target type
+_STR_CONVERTERS: Dict[Any, Callable[[str], Any]] = {
+    int: int,
+    float: float,
+    bool: _str_to_bool,
+}
@@ -2,8 +2,10 @@
 Factory for creating log destinations based on configuration.
 """
 from typing import Dict, List, Type, Optional, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from pathlib import Path
 import asyncio
+import weakref
 
 from .base import LogDestination, LogEntry
 from .sqlite import SQLiteDestination
@@ -14,11 +16,7 @@ class DestinationConfig:
     """Configuration for a single log destination."""
     type: str
     enabled: bool = True
-    settings: Dict[str, Any] = None
-
-    def __post_init__(self):
-        if self.settings is None:
-            self.settings = {}
+    settings: Dict[str, Any] = field(default_factory=dict)
 
 
 class MultiDestination(LogDestination):
@@ -26,20 +24,24 @@ class MultiDestination(LogDestination):
     
     def __init__(self, destinations: List[LogDestination]):
         self.destinations = destinations
+        # Resolve stats support once instead of probing with hasattr per call
+        self._stats_destinations = [dest for dest in destinations if hasattr(dest, 'get_stats')]
     
     async def write(self, entry: LogEntry) -> None:
         """Write to all destinations concurrently, ignoring individual failures."""
         if not self.destinations:
             return
-            
-        # Create tasks for all destinations
-        tasks = []
-        for dest in self.destinations:
-            task = asyncio.create_task(self._write_ignore_errors(dest, entry))
-            tasks.append(task)
-        
-        # Wait for all to complete (but don't raise exceptions)
-        await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Single destination: await directly, no task scheduling needed
+        if len(self.destinations) == 1:
+            await self._write_ignore_errors(self.destinations[0], entry)
+            return
+
+        # Let gather wrap the coroutines itself (but don't raise exceptions)
+        await asyncio.gather(
+            *(self._write_ignore_errors(dest, entry) for dest in self.destinations),
+            return_exceptions=True
+        )
     
     async def _write_ignore_errors(self, dest: LogDestination, entry: LogEntry) -> None:
         """Write to a single destination, ignoring errors."""
@@ -48,6 +50,24 @@ class MultiDestination(LogDestination):
         except Exception:
             # Silently ignore errors from individual destinations
             pass
+
+    async def write_many(self, entries: List[LogEntry]) -> None:
+        """Write a batch to all destinations concurrently, ignoring individual failures."""
+        if not self.destinations or not entries:
+            return
+
+        await asyncio.gather(
+            *(self._write_many_ignore_errors(dest, entries) for dest in self.destinations),
+            return_exceptions=True
+        )
+
+    async def _write_many_ignore_errors(self, dest: LogDestination, entries: List[LogEntry]) -> None:
+        """Write a batch to a single destination, ignoring errors."""
+        try:
+            await dest.write_many(entries)
+        except Exception:
+            # Silently ignore errors from individual destinations
+            pass
     
     async def query(self, **filters) -> List[LogEntry]:
         """Query the first destination that supports querying."""
@@ -62,21 +82,23 @@ class MultiDestination(LogDestination):
     
     async def get_stats(self) -> Dict[str, Any]:
         """Get stats from the first destination that supports it."""
-        for dest in self.destinations:
+        for dest in self._stats_destinations:
             try:
-                if hasattr(dest, 'get_stats'):
-                    return await dest.get_stats()
+                return await dest.get_stats()
             except Exception:
                 continue
         return {}
     
     async def close(self) -> None:
         """Close all destinations."""
-        tasks = []
-        for dest in self.destinations:
-            task = asyncio.create_task(self._close_ignore_errors(dest))
-            tasks.append(task)
-        await asyncio.gather(*tasks, return_exceptions=True)
+        if len(self.destinations) == 1:
+            await self._close_ignore_errors(self.destinations[0])
+            return
+
+        await asyncio.gather(
+            *(self._close_ignore_errors(dest) for dest in self.destinations),
+            return_exceptions=True
+        )
     
     async def _close_ignore_errors(self, dest: LogDestination) -> None:
         """Close a single destination, ignoring errors."""
@@ -94,6 +116,22 @@ class LogDestinationFactory:
         'sqlite': SQLiteDestination,
     }
     
+    # Live SQLite destinations keyed by data directory, so repeated
+    # initialization in one process skips the schema setup. Only the
+    # destination object is shared: each thread still opens its own
+    # connection through SQLiteDestination's thread-local storage.
+    _sqlite_instances: "weakref.WeakValueDictionary[Path, SQLiteDestination]" = weakref.WeakValueDictionary()
+    
+    @classmethod
+    def _get_shared_sqlite(cls, server_config: Any) -> SQLiteDestination:
+        """Get the shared SQLite destination object for a server config."""
+        key = Path(server_config.data_dir)
+        destination = cls._sqlite_instances.get(key)
+        if destination is None:
+            destination = SQLiteDestination(server_config)
+            cls._sqlite_instances[key] = destination
+        return destination
+    
     @classmethod
     def register_destination(cls, type_name: str, destination_class: Type[LogDestination]) -> None:
         """Register a new destination type."""
@@ -114,6 +152,9 @@ class LogDestinationFactory:
             # Unknown destination type - skip it
             return None
         
+        if destination_class is SQLiteDestination and not config.settings:
+            return cls._get_shared_sqlite(server_config)
+        
         try:
             # Create destination with server config and any additional settings
             return destination_class(server_config, **config.settings)
@@ -138,7 +179,7 @@ class LogDestinationFactory:
         # Return appropriate destination
         if len(destinations) == 0:
             # No destinations configured - fall back to SQLite
-            return SQLiteDestination(server_config)
+            return cls._get_shared_sqlite(server_config)
         elif len(destinations) == 1:
             # Single destination
             return destinations[0]
@@ -6,10 +6,12 @@ write to pluggable destinations while intercepting both Loguru and standard
 Python logging.
 """
 
+import atexit
 import logging
 import sys
 import asyncio
-from typing import Optional, Any, Dict, List
+import threading
+from typing import Optional, Any, Callable, Dict, List
 from datetime import datetime
 
 from loguru import logger
@@ -20,28 +22,179 @@ from .destinations.factory import LogDestinationFactory, DestinationConfig
 from .destinations.sqlite import SQLiteDestination
 
 
+class _LoopThread:
+    """A daemon thread running one persistent event loop for sync callers."""
+    
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self.loop.run_forever,
+            name="unified-logger-loop",
+            daemon=True
+        )
+        self._thread.start()
+    
+    def stop(self, timeout: float) -> None:
+        """Give pending tasks up to timeout seconds, then stop and close the loop."""
+        async def drain():
+            pending = asyncio.all_tasks() - {asyncio.current_task()}
+            if pending:
+                await asyncio.wait(pending, timeout=timeout)
+        
+        asyncio.run_coroutine_threadsafe(drain(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        
+        # Cancel whatever outlived the drain so no task is destroyed pending
+        pending = asyncio.all_tasks(self.loop)
+        for task in pending:
+            task.cancel()
+        if pending:
+            self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        self.loop.close()
+
+
+_LOOP_THREAD: Optional[_LoopThread] = None
+_LOOP_THREAD_LOCK = threading.Lock()
+
+# Set by the exit hook; no new background loop is started after that
+_shutting_down = False
+
+# Longest a log write handed to an event loop may block its caller
+_WRITE_TIMEOUT = 5.0
+
+
+def run_coro(
+    coro,
+    timeout: Optional[float] = None,
+    loop: Optional[asyncio.AbstractEventLoop] = None
+) -> Any:
+    """Run a coroutine from synchronous code and wait for its result.
+    
+    The coroutine runs on loop when given. Otherwise it is submitted to a
+    shared background loop that is started on first use, so sync callers
+    don't create and tear down a loop per call. A coroutine still running
+    after timeout seconds is cancelled and TimeoutError is raised.
+    
+    Raises RuntimeError instead of starting the background loop once the
+    interpreter is exiting.
+    """
+    global _LOOP_THREAD
+    if loop is None:
+        with _LOOP_THREAD_LOCK:
+            if _LOOP_THREAD is None:
+                if _shutting_down:
+                    coro.close()
+                    raise RuntimeError("Not starting the background loop during interpreter shutdown")
+                _LOOP_THREAD = _LoopThread()
+            loop = _LOOP_THREAD.loop
+    
+    future = asyncio.run_coroutine_threadsafe(coro, loop)
+    try:
+        return future.result(timeout)
+    except TimeoutError:
+        future.cancel()
+        raise
+
+
+def _stop_loop_thread() -> None:
+    """Stop the shared background loop; run_coro starts a new one if needed."""
+    global _LOOP_THREAD
+    with _LOOP_THREAD_LOCK:
+        loop_thread, _LOOP_THREAD = _LOOP_THREAD, None
+    if loop_thread is not None:
+        loop_thread.stop(_WRITE_TIMEOUT)
+
+
+class _LogBatcher:
+    """Buffers log entries and writes them out in batches from a daemon thread.
+    
+    A batch is flushed once BATCH_SIZE entries are buffered or FLUSH_INTERVAL
+    seconds after its first entry arrived, whichever comes first.
+    """
+    
+    BATCH_SIZE = 100
+    FLUSH_INTERVAL = 0.05
+    
+    def __init__(self, write_batch: Callable[[List[LogEntry]], None]):
+        self._write_batch = write_batch
+        self._buffer: List[LogEntry] = []
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run,
+            name="unified-logger-flush",
+            daemon=True
+        )
+        self._thread.start()
+    
+    def add(self, entry: LogEntry) -> None:
+        """Buffer an entry, or write it straight through once closed."""
+        with self._condition:
+            if not self._closed:
+                self._buffer.append(entry)
+                if len(self._buffer) == 1 or len(self._buffer) >= self.BATCH_SIZE:
+                    self._condition.notify()
+                return
+        self._write_batch([entry])
+    
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._buffer or self._closed)
+                if not self._buffer:
+                    # Closed and fully drained
+                    return
+                self._condition.wait_for(
+                    lambda: self._closed or len(self._buffer) >= self.BATCH_SIZE,
+                    timeout=self.FLUSH_INTERVAL
+                )
+                batch = self._buffer[:self.BATCH_SIZE]
+                del self._buffer[:self.BATCH_SIZE]
+            self._write_batch(batch)
+    
+    def close(self) -> None:
+        """Flush everything still buffered and stop the flush thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+
+
 class UnifiedLogger:
     """Factory for creating correlation-aware loggers with pluggable destinations."""
     
     _destination: Optional[LogDestination] = None
     _initialized: bool = False
     _event_loop: Optional[asyncio.AbstractEventLoop] = None
+    _batcher: Optional[_LogBatcher] = None
+    _level_no: int = 0
     
     @classmethod
-    def initialize(cls, destination: LogDestination, event_loop: Optional[asyncio.AbstractEventLoop] = None):
+    def initialize(
+        cls,
+        destination: LogDestination,
+        event_loop: Optional[asyncio.AbstractEventLoop] = None,
+        level: str = "DEBUG"
+    ):
         """Initialize the unified logging system with a specific destination.
         
         Args:
             destination: The LogDestination implementation to use
             event_loop: Optional event loop for async operations. If not provided,
                        will attempt to get the current running loop when needed.
+            level: Minimum level the destination receives, e.g. "INFO"
         """
         if cls._initialized:
             # Clean up previous configuration
             logger.remove()
+            if cls._batcher:
+                cls._batcher.close()
         
         cls._destination = destination
         cls._event_loop = event_loop
+        cls._batcher = _LogBatcher(cls._write_batch)
+        cls._level_no = logger.level(level.upper()).no
         cls._initialized = True
         
         # Remove default Loguru handler
@@ -50,7 +203,7 @@ class UnifiedLogger:
         # Add custom sink that writes to destination
         logger.add(
             cls._log_sink,
-            level="DEBUG",
+            level=cls._level_no,
             enqueue=True,  # Thread-safe enqueueing
             serialize=False  # We'll handle serialization ourselves
         )
@@ -70,9 +223,11 @@ class UnifiedLogger:
         """Custom Loguru sink that writes to the configured destination.
         
         This method is called by Loguru for each log message and converts
-        it to our unified LogEntry format before writing to the destination.
+        it to our unified LogEntry format. Entries are buffered and written to
+        the destination in batches by _write_batch.
         """
-        if not cls._destination:
+        batcher = cls._batcher
+        if not cls._destination or not batcher:
             return
         
         record = message.record
@@ -104,35 +259,31 @@ class UnifiedLogger:
                                    "input_args", "output_summary", "error_message"]}
         )
         
-        # Write to destination
-        # SQLiteDestination has both sync and async write methods
-        # Always use the sync method since SQLite operations are synchronous anyway
-        if hasattr(cls._destination, 'write_sync'):
-            # SQLite destination - use sync write directly
-            try:
-                cls._destination.write_sync(entry)
-            except Exception as e:
-                import sys
-                print(f"Warning: Could not write log entry: {e}", file=sys.stderr)
-        else:
-            # Other destinations that might be truly async
-            try:
-                loop = cls._event_loop
-                if not loop:
-                    try:
-                        loop = asyncio.get_running_loop()
-                    except RuntimeError:
-                        loop = None
-                
-                if loop and loop.is_running():
-                    # We're in an async context with a running loop
-                    asyncio.create_task(cls._destination.write(entry))
-                else:
-                    # We're in a sync context or no loop is running
-                    asyncio.run(cls._destination.write(entry))
-            except Exception as e:
-                import sys
-                print(f"Warning: Could not write log entry: {e}", file=sys.stderr)
+        batcher.add(entry)
+    
+    @classmethod
+    def _write_batch(cls, entries: List[LogEntry]) -> None:
+        """Write a batch of entries to the destination from the flush thread."""
+        destination = cls._destination
+        if not destination:
+            return
+        
+        try:
+            if hasattr(destination, 'write_many_sync'):
+                # SQLite destination - one executemany and commit per batch
+                destination.write_many_sync(entries)
+            else:
+                # Hand off to the app loop the destination was created on, or
+                # to the shared background loop when no app loop is running
+                loop = cls._event_loop if cls._event_loop and cls._event_loop.is_running() else None
+                run_coro(destination.write_many(entries), timeout=_WRITE_TIMEOUT, loop=loop)
+        except TimeoutError:
+            print(
+                f"Warning: Timed out after {_WRITE_TIMEOUT}s writing {len(entries)} log entries",
+                file=sys.stderr
+            )
+        except Exception as e:
+            print(f"Warning: Could not write log entries: {e}", file=sys.stderr)
     
     @classmethod
     def get_logger(cls, name: Optional[str] = None):
@@ -164,11 +315,19 @@ class UnifiedLogger:
     @classmethod
     async def close(cls):
         """Close the logging system and clean up resources."""
+        if cls._batcher:
+            # Let Loguru's queue reach the sink, then flush off this loop,
+            # since a batch may be handed off to it
+            logger.complete()
+            await asyncio.to_thread(cls._batcher.close)
+            cls._batcher = None
         if cls._destination:
             await cls._destination.close()
             cls._destination = None
         cls._initialized = False
+        cls._level_no = 0
         logger.remove()
+        await asyncio.to_thread(_stop_loop_thread)
     
     @classmethod
     def initialize_from_config(cls, destinations_config: List[DestinationConfig], server_config, event_loop: Optional[asyncio.AbstractEventLoop] = None):
@@ -182,7 +341,7 @@ class UnifiedLogger:
             event_loop: Optional event loop for async operations
         """
         destination = LogDestinationFactory.create_from_config(destinations_config, server_config)
-        cls.initialize(destination, event_loop)
+        cls.initialize(destination, event_loop, server_config.log_level)
     
     @classmethod
     def initialize_default(cls, server_config, event_loop: Optional[asyncio.AbstractEventLoop] = None):
@@ -195,7 +354,7 @@ class UnifiedLogger:
         # Create a default SQLite configuration
         default_config = [DestinationConfig(type='sqlite', enabled=True)]
         destination = LogDestinationFactory.create_from_config(default_config, server_config)
-        cls.initialize(destination, event_loop)
+        cls.initialize(destination, event_loop, server_config.log_level)
     
     @classmethod
     def get_available_destinations(cls) -> List[str]:
@@ -205,6 +364,34 @@ class UnifiedLogger:
             List of registered destination type names
         """
         return LogDestinationFactory.get_available_types()
+    
+    @classmethod
+    def is_enabled_for(cls, level: int) -> bool:
+        """Check whether records at a numeric level reach the unified sink.
+        
+        Args:
+            level: Numeric level, e.g. logging.INFO
+        """
+        return level >= cls._level_no
+
+
+def _shutdown() -> None:
+    """Flush buffered log entries, then stop the background loop at exit.
+    
+    Batches for async destinations are only written if the background loop
+    is already running; the remainder is reported as a write warning.
+    """
+    global _shutting_down
+    _shutting_down = True
+    batcher = UnifiedLogger._batcher
+    if batcher:
+        logger.complete()
+        batcher.close()
+    _stop_loop_thread()
+
+
+# Registered after Loguru's own exit hook, so it runs before handlers are removed
+atexit.register(_shutdown)
 
 
 class InterceptHandler(logging.Handler):
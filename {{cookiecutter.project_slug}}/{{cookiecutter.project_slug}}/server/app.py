@@ -3,16 +3,30 @@
 This module implements the core MCP server using FastMCP with multi-transport support
 (STDIO, SSE, and Streamable HTTP) and automatic application of SAAGA decorators 
 (exception handling, logging, parallelization).
+
+Setting {{ cookiecutter.project_slug|upper }}_UVLOOP=1 runs the server on uvloop when it is installed,
+which lowers the per-await scheduling overhead of I/O-bound tools.
 """
 
 import asyncio
+import logging
+import os
 import sys
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, List
 
 import click
 from mcp import types
 from mcp.server.fastmcp import FastMCP
 
+try:
+    import uvloop
+except ImportError:
+    # Optional (and unavailable on Windows) - fall back to the default loop
+    uvloop = None
+
+# Environment variable that opts the server into uvloop
+UVLOOP_ENV_VAR = "{{ cookiecutter.project_slug|upper }}_UVLOOP"
+
 from {{ cookiecutter.project_slug }}.config import ServerConfig, get_config
 from {{ cookiecutter.project_slug }}.logging_config import setup_logging, logger
 from {{ cookiecutter.project_slug }}.log_system.correlation import (
@@ -20,24 +34,43 @@ from {{ cookiecutter.project_slug }}.log_system.correlation import (
     set_initialization_correlation_id,
     clear_initialization_correlation_id
 )
+from {{ cookiecutter.project_slug }}.log_system.destinations import DestinationConfig
 from {{ cookiecutter.project_slug }}.log_system.unified_logger import UnifiedLogger
 {% if cookiecutter.include_example_tools == "yes" -%}
+from {{ cookiecutter.project_slug }}.decorators.exception_handler import exception_handler
+from {{ cookiecutter.project_slug }}.decorators.tool_logger import tool_logger
+from {{ cookiecutter.project_slug }}.decorators.type_converter import type_converter
+from {{ cookiecutter.project_slug }}.decorators.parallelize import parallelize
+{% if cookiecutter.include_oauth_passthrough == "yes" -%}
+from {{ cookiecutter.project_slug }}.decorators.oauth_passthrough import oauth_passthrough
+{% endif -%}
 from {{ cookiecutter.project_slug }}.tools.example_tools import example_tools, parallel_example_tools
 {% endif -%}
 {% if cookiecutter.include_oauth_passthrough == "yes" -%}
-from {{ cookiecutter.project_slug }}.tools.github_passthrough_tools import oauth_passthrough_tools
-{% endif -%}
+from {{ cookiecutter.project_slug }}.tools.github_passthrough_tools import oauth_passthrough_tools, close_github_client
+{% endif %}
+# Server built from the global configuration, shared by every caller that
+# doesn't pass its own config
+_default_server: Optional[FastMCP] = None
+
 
 def create_mcp_server(config: Optional[ServerConfig] = None) -> FastMCP:
     """Create and configure the MCP server with SAAGA decorators.
     
+    Calls without a config return the same server instance, so logging
+    initialization and tool registration only run once per process.
+    
     Args:
         config: Optional server configuration
         
     Returns:
         Configured FastMCP server instance
     """
-    if config is None:
+    global _default_server
+    use_default = config is None
+    if use_default:
+        if _default_server is not None:
+            return _default_server
         config = get_config()
     
     # Set startup correlation ID BEFORE initializing logging
@@ -46,15 +79,13 @@ def create_mcp_server(config: Optional[ServerConfig] = None) -> FastMCP:
     
     # Initialize unified logging using factory pattern
     # Convert logging_destinations dict to DestinationConfig objects
-    from {{ cookiecutter.project_slug }}.log_system.destinations import DestinationConfig
-    
     destinations_list = []
     if config.logging_destinations and 'destinations' in config.logging_destinations:
         for dest_dict in config.logging_destinations['destinations']:
             dest_config = DestinationConfig(
                 type=dest_dict.get('type', 'sqlite'),
                 enabled=dest_dict.get('enabled', True),
-                settings=dest_dict.get('settings', {})
+                settings=dest_dict.get('settings') or {}
             )
             destinations_list.append(dest_config)
     
@@ -69,7 +100,6 @@ def create_mcp_server(config: Optional[ServerConfig] = None) -> FastMCP:
     # setup_logging(config)  # Temporarily disabled to test unified logging
     
     # Log startup info using unified logger
-    import logging
     unified_logger = logging.getLogger('{{ cookiecutter.project_slug }}')
     unified_logger.info(f"Unified logging initialized with {len(UnifiedLogger.get_available_destinations())} available destination types")
     unified_logger.info(f"Server config: {config.name} at log level {config.log_level}")
@@ -88,6 +118,9 @@ def create_mcp_server(config: Optional[ServerConfig] = None) -> FastMCP:
     unified_logger.info("Server initialization complete")
     clear_initialization_correlation_id()
     
+    if use_default:
+        _default_server = mcp_server
+    
     return mcp_server
 
 
@@ -100,17 +133,10 @@ def register_tools(mcp_server: FastMCP, config: ServerConfig) -> None:
     """
     
     # Get unified logger for registration logs
-    import logging
     unified_logger = logging.getLogger('{{ cookiecutter.project_slug }}')
     
-    # Import SAAGA decorators
-    from {{ cookiecutter.project_slug }}.decorators.exception_handler import exception_handler
-    from {{ cookiecutter.project_slug }}.decorators.tool_logger import tool_logger
-    from {{ cookiecutter.project_slug }}.decorators.type_converter import type_converter
-    from {{ cookiecutter.project_slug }}.decorators.parallelize import parallelize
-    {% if cookiecutter.include_oauth_passthrough == "yes" -%}
-    from {{ cookiecutter.project_slug }}.decorators.oauth_passthrough import oauth_passthrough
-    {% endif -%}
+    # Names are collected and logged once at the end instead of per tool
+    registered_names: List[str] = []
     
     # Register regular tools with SAAGA decorators
     for tool_func in example_tools:
@@ -126,7 +152,7 @@ def register_tools(mcp_server: FastMCP, config: ServerConfig) -> None:
             name=tool_name
         )(decorated_func)
         
-        unified_logger.info(f"Registered tool: {tool_name}")
+        registered_names.append(tool_name)
     
     {% if cookiecutter.include_parallel_example == "yes" -%}
     # Register parallel tools with SAAGA decorators  
@@ -143,7 +169,7 @@ def register_tools(mcp_server: FastMCP, config: ServerConfig) -> None:
             name=tool_name
         )(decorated_func)
         
-        unified_logger.info(f"Registered parallel tool: {tool_name}")
+        registered_names.append(f"{tool_name} (parallel)")
     {% endif -%}
     
     {% if cookiecutter.include_oauth_passthrough == "yes" -%}
@@ -166,14 +192,26 @@ def register_tools(mcp_server: FastMCP, config: ServerConfig) -> None:
             name=tool_func.__name__
         )(decorated_func)
         
-        unified_logger.info(f"Registered OAuth passthrough tool: {tool_func.__name__} (provider: {provider})")
+        registered_names.append(f"{tool_func.__name__} (OAuth passthrough: {provider})")
     {% endif -%}
     
+    unified_logger.info(f"Registered {len(registered_names)} tools: {', '.join(registered_names)}")
     unified_logger.info(f"Server '{mcp_server.name}' initialized with SAAGA decorators")
-{% endif -%}
+{% endif %}
+
+# PEP 562 module __getattr__: ``server`` is not a real module attribute but is
+# built on first access, e.g. when the MCP CLI imports this module and reads
+# ``server``. The package and ``server`` package __init__ modules forward to it.
+def __getattr__(name: str) -> Any:
+    """Build the default server instance when ``server`` is first accessed.
+    
+    Importing this module stays cheap; logging setup and tool
+    registration only run once something asks for ``server``.
+    """
+    if name == "server":
+        return create_mcp_server()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Create a server instance that can be imported by the MCP CLI
-server = create_mcp_server()
 
 @click.command()
 @click.option(
@@ -189,6 +227,8 @@ server = create_mcp_server()
 )
 def main(port: int, transport: str) -> int:
     """Run the {{ cookiecutter.project_name }} server with specified transport."""
+    server = create_mcp_server()
+    
     async def run_server():
         """Inner async function to run the server and manage the event loop."""
         # Set the event loop in UnifiedLogger for async operations
@@ -210,11 +250,22 @@ def main(port: int, transport: str) -> int:
             else:
                 raise ValueError(f"Unknown transport: {transport}")
         finally:
+            {% if cookiecutter.include_oauth_passthrough == "yes" -%}
+            # Close pooled connections held by the GitHub tools
+            await close_github_client()
+            {% endif -%}
             # Clean up unified logger
             await UnifiedLogger.close()
     
+    use_uvloop = os.environ.get(UVLOOP_ENV_VAR, "").lower() in ("1", "true", "yes")
+    if use_uvloop and uvloop is None:
+        logger.warning(f"{UVLOOP_ENV_VAR} is set but uvloop is not installed; using the default event loop")
+    
     try:
-        asyncio.run(run_server())
+        if use_uvloop and uvloop is not None:
+            uvloop.run(run_server())
+        else:
+            asyncio.run(run_server())
         return 0
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
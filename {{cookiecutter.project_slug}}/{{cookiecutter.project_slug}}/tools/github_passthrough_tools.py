@@ -9,105 +9,370 @@ These tools demonstrate the token passthrough pattern where:
 NO OAuth flow handling, NO token storage, NO auth URLs.
 """
 
+import asyncio
+import contextvars
 import httpx
+import json
 import logging
-from typing import Dict, Any, List, Optional
+import random
+import re
+import time
+from email.utils import parsedate_to_datetime
+from operator import itemgetter
+from typing import Awaitable, Callable, Dict, Any, List, Optional, Tuple
 from mcp.server.fastmcp import Context
 
 # Set up logging for internal feedback
 logger = logging.getLogger('{{ cookiecutter.project_slug }}.github_tools')
 
-async def get_github_user(ctx: Context = None) -> Dict[str, Any]:
-    """Get authenticated GitHub user information.
+GITHUB_API_URL = "https://api.github.com"
+
+# HTTP/2 lets concurrent calls share one multiplexed connection. httpx only
+# supports it when the optional h2 package is installed (httpx[http2]).
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Parse and encode bodies with orjson when it is installed. It works on raw
+# bytes directly, skipping the str round trip httpx's json handling goes through.
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+_JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+
+# Repository fields returned by the repo tools. GitHub always includes these
+# keys (null when unset), so they are read with one C-level itemgetter call.
+_REPO_FIELDS = (
+    "name",
+    "full_name",
+    "description",
+    "private",
+    "html_url",
+    "language",
+    "stargazers_count",
+    "updated_at"
+)
+_get_repo_fields = itemgetter(*_REPO_FIELDS)
+
+# Upper bound on concurrent requests issued by a single bulk tool call
+MAX_CONCURRENT_REQUESTS = 16
+# Largest repository list get_github_repos accepts in one call
+MAX_REPOS_PER_CALL = 100
+
+# "owner/repo" as GitHub allows it: owners are up to 39 alphanumerics or
+# hyphens, not starting with a hyphen; repos are up to 100 alphanumerics,
+# '.', '_' or '-', and never '.' or '..' so the name can't escape the URL path
+_REPO_NAME_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9-]{0,38}/(?!\.\.?$)[A-Za-z0-9._-]{1,100}")
+
+# Static error responses. Tools return copies because oauth_passthrough
+# adds provider details to unauthorized/forbidden results in place.
+_UNAUTHORIZED = {
+    "error": "unauthorized",
+    "message": "Invalid or expired OAuth token",
+    "status_code": 401
+}
+_TIMEOUT = {
+    "error": "timeout",
+    "message": "Request to GitHub API timed out"
+}
+_NO_CONTEXT = {
+    "error": "no_context",
+    "message": "Context not available for OAuth token extraction"
+}
+_NO_TOKEN = {
+    "error": "no_token",
+    "message": "OAuth token not found in context"
+}
+# Same response oauth_passthrough gives when the client sent no token
+_TOKEN_NOT_PROVIDED = {
+    "error": "token_not_provided",
+    "message": "No github token provided by client",
+    "provider": "github",
+    "details": "The client must provide OAuth tokens via Context in the oauth_tokens dictionary"
+}
+_FORBIDDEN_ISSUE = {
+    "error": "forbidden",
+    "message": "Token lacks permission to create issues in this repository",
+    "status_code": 403
+}
+
+# Known error statuses mapped to their responses; anything else is an api_error
+_ERROR_BY_STATUS = {401: _UNAUTHORIZED}
+_ISSUE_ERROR_BY_STATUS = {**_ERROR_BY_STATUS, 403: _FORBIDDEN_ISSUE}
+
+# Rate-limited responses are retried this many times before being returned
+MAX_RATE_LIMIT_RETRIES = 3
+# Longest wait (seconds) for a rate limit to reset before giving up instead
+MAX_RATE_LIMIT_WAIT = 60.0
+# Timed-out requests are retried this many times, backing off from this base
+MAX_TIMEOUT_RETRIES = 2
+TIMEOUT_BACKOFF_BASE = 0.5
+
+# Separate budgets per phase so a slow read doesn't eat into the connect
+# budget, and a dead host or exhausted pool fails fast
+GITHUB_TIMEOUT = httpx.Timeout(connect=2.0, read=10.0, write=5.0, pool=1.0)
+
+# OAuth token for the tool call in progress. Each tool call runs in its own
+# context, so concurrent calls for different users never see each other's token.
+_current_token: contextvars.ContextVar[str] = contextvars.ContextVar("github_oauth_token")
+
+
+class _BearerAuth(httpx.Auth):
+    """Adds the current tool call's OAuth token as a bearer Authorization header."""
     
-    Retrieves information about the authenticated user using the
-    OAuth token passed via Context.
+    def auth_flow(self, request: httpx.Request):
+        request.headers["Authorization"] = f"Bearer {_current_token.get()}"
+        yield request
+
+
+_AUTH = _BearerAuth()
+
+# Shared client so connections to the GitHub API are pooled and kept alive
+# across tool calls instead of paying a TCP+TLS handshake per request. It is
+# created on first use on the server's event loop and closed by the server's
+# main() when it stops.
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Get the shared GitHub API client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=GITHUB_API_URL,
+            headers={
+                "Accept": "application/vnd.github+json",
+                "X-GitHub-Api-Version": "2022-11-28",
+                "User-Agent": "{{ cookiecutter.project_slug }}"
+            },
+            timeout=GITHUB_TIMEOUT,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0),
+            http2=HTTP2_AVAILABLE
+        )
+    return _client
+
+
+async def close_github_client() -> None:
+    """Close the shared GitHub API client, if one was created."""
+    global _client
+    client, _client = _client, None
+    if client is not None:
+        await client.aclose()
+
+
+def _rate_limit_delay(response: httpx.Response, attempt: int) -> Optional[float]:
+    """Get how long to wait before retrying a rate-limited GitHub response.
+    
+    GitHub signals rate limiting with 429, or 403 plus rate limit headers.
+    Retry-After (seconds or an HTTP date) is used when present, then
+    X-RateLimit-Reset (epoch seconds) once the remaining budget is exhausted,
+    then exponential backoff. An unparseable Retry-After or X-RateLimit-Reset
+    also falls back to the backoff delay.
+    
+    Returns:
+        Seconds to wait, or None if the response is not rate limited
+    """
+    if response.status_code not in (403, 429):
+        return None
+    
+    headers = response.headers
+    retry_after = headers.get("retry-after")
+    if retry_after is not None:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+        except (TypeError, ValueError):
+            logger.warning("Ignoring unparseable Retry-After header: %r", retry_after)
+            return float(2 ** attempt)
+    if headers.get("x-ratelimit-remaining") == "0" and headers.get("x-ratelimit-reset") is not None:
+        try:
+            return max(0.0, float(headers["x-ratelimit-reset"]) - time.time())
+        except ValueError:
+            logger.warning("Ignoring unparseable X-RateLimit-Reset header: %r", headers["x-ratelimit-reset"])
+            return float(2 ** attempt)
+    if response.status_code == 429:
+        return float(2 ** attempt)
+    # A 403 without rate limit headers is a genuine permission error
+    return None
+
+
+async def _send_with_retry(
+    send: Callable[..., Awaitable[httpx.Response]],
+    url: str,
+    idempotent: bool = True,
+    **kwargs
+) -> httpx.Response:
+    """Send a GitHub API request, retrying timeouts and waiting out rate limits.
+    
+    Timeouts are retried with jittered exponential backoff. For requests that
+    are not idempotent only connect and pool timeouts are retried, since the
+    request never reached GitHub.
     
     Args:
-        ctx: MCP Context containing OAuth token
+        send: Bound client method to call, e.g. client.get
+        url: Request URL relative to the GitHub API base URL
+        idempotent: Whether the request is safe to send more than once
+        **kwargs: Passed through to the client method
         
     Returns:
-        Dict containing user information or error
+        The first response that is not rate limited, or the last one if the
+        retries run out or the reset is too far away to wait for
+        
+    Raises:
+        httpx.TimeoutException: If the request still times out after retrying
     """
-    logger.info("Attempting to get GitHub user information")
+    rate_limit_attempt = 0
+    timeout_attempt = 0
+    while True:
+        try:
+            response = await send(url, **kwargs)
+        except httpx.TimeoutException as e:
+            retryable = idempotent or isinstance(e, (httpx.ConnectTimeout, httpx.PoolTimeout))
+            if not retryable or timeout_attempt == MAX_TIMEOUT_RETRIES:
+                raise
+            delay = random.uniform(0, TIMEOUT_BACKOFF_BASE * 2 ** timeout_attempt)
+            timeout_attempt += 1
+            logger.warning("GitHub API request timed out (%s), retrying in %.1fs", type(e).__name__, delay)
+            await asyncio.sleep(delay)
+            continue
+        
+        delay = _rate_limit_delay(response, rate_limit_attempt)
+        if delay is None or rate_limit_attempt == MAX_RATE_LIMIT_RETRIES or delay > MAX_RATE_LIMIT_WAIT:
+            return response
+        rate_limit_attempt += 1
+        logger.warning("GitHub API rate limit hit (status %s), retrying in %.1fs", response.status_code, delay)
+        await asyncio.sleep(delay)
+
+
+def _extract_token(ctx: Optional[Context]) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """Get the OAuth token the oauth_passthrough decorator placed in Context meta.
     
-    if not ctx or not hasattr(ctx, 'request_context') or not hasattr(ctx.request_context, 'meta'):
+    Returns:
+        (token, None) on success, or (None, error_dict) when the context,
+        request metadata or token is missing
+    """
+    try:
+        meta = ctx.request_context.meta
+    except (AttributeError, ValueError):
         logger.error("Context not available or improperly structured")
-        return {
-            "error": "no_context",
-            "message": "Context not available for OAuth token extraction"
-        }
-    
-    # Token should be added by oauth_passthrough decorator
-    meta = ctx.request_context.meta
-    token = None
+        return None, dict(_NO_CONTEXT)
+    if meta is None:
+        # The client sent no request metadata, so it sent no token either
+        logger.error("No request metadata in context")
+        return None, dict(_TOKEN_NOT_PROVIDED)
     
-    # Try different ways to get the token from meta
+    # Meta can be a dict or an object with attributes
     if hasattr(meta, 'get'):
         token = meta.get('current_oauth_token')
-    elif hasattr(meta, 'current_oauth_token'):
+    else:
         token = getattr(meta, 'current_oauth_token', None)
     
     if not token:
         # This shouldn't happen if oauth_passthrough decorator is working
         logger.error("OAuth token not found in context meta")
-        return {
-            "error": "no_token",
-            "message": "OAuth token not found in context"
-        }
+        return None, dict(_NO_TOKEN)
+    return token, None
+
+
+def _error_response(
+    response: httpx.Response,
+    errors: Dict[int, Dict[str, Any]] = _ERROR_BY_STATUS
+) -> Dict[str, Any]:
+    """Build the error result for an unsuccessful GitHub API response.
+    
+    Args:
+        response: The GitHub API response
+        errors: Error responses for known status codes
+        
+    Returns:
+        A copy of the known error for the status, or a generic api_error
+    """
+    error = errors.get(response.status_code)
+    if error is not None:
+        logger.error("GitHub API returned %s (%s)", response.status_code, error["error"])
+        return dict(error)
+    
+    logger.error("GitHub API returned unexpected status: %s", response.status_code)
+    return {
+        "error": "api_error",
+        "message": f"GitHub API returned status {response.status_code}",
+        "status_code": response.status_code,
+        "response": response.text
+    }
+
+
+def _simplify_repo(repo: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the key fields from a GitHub repository payload."""
+    try:
+        return dict(zip(_REPO_FIELDS, _get_repo_fields(repo)))
+    except KeyError:
+        # Partial payload - missing fields become None
+        return {field: repo.get(field) for field in _REPO_FIELDS}
+
+
+async def get_github_user(ctx: Context = None) -> Dict[str, Any]:
+    """Get authenticated GitHub user information.
+    
+    Retrieves information about the authenticated user using the
+    OAuth token passed via Context.
+    
+    Args:
+        ctx: MCP Context containing OAuth token
+        
+    Returns:
+        Dict containing user information or error
+    """
+    logger.info("Attempting to get GitHub user information")
+    
+    token, error = _extract_token(ctx)
+    if error:
+        return error
     
-    logger.info(f"Using OAuth token (first 10 chars): {token[:10]}...")
+    logger.info("Using OAuth token (first 10 chars): %s...", token[:10])
     
     # Use the token to call GitHub API
+    token_reset = _current_token.set(token)
     try:
-        async with httpx.AsyncClient() as client:
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Accept": "application/vnd.github+json",
-                "X-GitHub-Api-Version": "2022-11-28"
-            }
-            
-            logger.info("Making request to GitHub API")
-            response = await client.get(
-                "https://api.github.com/user",
-                headers=headers,
-                timeout=10.0
-            )
-            
-            logger.info(f"GitHub API response status: {response.status_code}")
+        client = _get_client()
+        
+        logger.info("Making request to GitHub API")
+        response = await _send_with_retry(
+            client.get,
+            "/user",
+            auth=_AUTH
+        )
+        
+        logger.info("GitHub API response status: %s", response.status_code)
+        
+        if response.status_code == 200:
+            data = _json_loads(response.content)
+            logger.info("Successfully retrieved user: %s", data.get('login', 'unknown'))
+            return data
+        return _error_response(response)
             
-            if response.status_code == 200:
-                data = response.json()
-                logger.info(f"Successfully retrieved user: {data.get('login', 'unknown')}")
-                return data
-            elif response.status_code == 401:
-                logger.error("GitHub API returned 401 Unauthorized")
-                return {
-                    "error": "unauthorized",
-                    "message": "Invalid or expired OAuth token",
-                    "status_code": 401
-                }
-            else:
-                logger.error(f"GitHub API returned unexpected status: {response.status_code}")
-                return {
-                    "error": "api_error",
-                    "message": f"GitHub API returned status {response.status_code}",
-                    "status_code": response.status_code,
-                    "response": response.text
-                }
-                
     except httpx.TimeoutException:
         logger.error("Request to GitHub API timed out")
-        return {
-            "error": "timeout",
-            "message": "Request to GitHub API timed out"
-        }
+        return dict(_TIMEOUT)
     except Exception as e:
-        logger.error(f"Unexpected error calling GitHub API: {e}")
+        logger.error("Unexpected error calling GitHub API: %s", e)
         return {
             "error": "request_failed",
             "message": f"Failed to call GitHub API: {str(e)}"
         }
+    finally:
+        _current_token.reset(token_reset)
 
 
 async def list_user_repos(
@@ -127,113 +392,167 @@ async def list_user_repos(
     Returns:
         Dict containing list of repositories or error
     """
-    logger.info(f"Attempting to list user repos (page={page}, per_page={per_page}, sort={sort})")
+    logger.info("Attempting to list user repos (page=%s, per_page=%s, sort=%s)", page, per_page, sort)
     
-    if not ctx or not hasattr(ctx, 'request_context') or not hasattr(ctx.request_context, 'meta'):
-        logger.error("Context not available or improperly structured")
-        return {
-            "error": "no_context",
-            "message": "Context not available for OAuth token extraction"
-        }
+    token, error = _extract_token(ctx)
+    if error:
+        return error
     
-    # Get token from meta
-    meta = ctx.request_context.meta
-    token = None
-    
-    if hasattr(meta, 'get'):
-        token = meta.get('current_oauth_token')
-    elif hasattr(meta, 'current_oauth_token'):
-        token = getattr(meta, 'current_oauth_token', None)
-    
-    if not token:
-        logger.error("OAuth token not found in context meta")
-        return {
-            "error": "no_token",
-            "message": "OAuth token not found in context"
-        }
-    
-    logger.info(f"Using OAuth token to list repositories")
+    logger.info("Using OAuth token to list repositories")
     
     # Validate parameters
     per_page = min(max(1, per_page), 100)  # GitHub max is 100
     page = max(1, page)
     
+    token_reset = _current_token.set(token)
     try:
-        async with httpx.AsyncClient() as client:
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Accept": "application/vnd.github+json",
-                "X-GitHub-Api-Version": "2022-11-28"
-            }
+        client = _get_client()
+        
+        params = {
+            "per_page": per_page,
+            "page": page,
+            "sort": sort
+        }
+        
+        logger.info("Making request to GitHub API with params: %s", params)
+        response = await _send_with_retry(
+            client.get,
+            "/user/repos",
+            auth=_AUTH,
+            params=params
+        )
+        
+        logger.info("GitHub API response status: %s", response.status_code)
+        
+        if response.status_code == 200:
+            repos = _json_loads(response.content)
+            logger.info("Successfully retrieved %d repositories", len(repos))
+            
+            # Extract key information from each repo
+            simplified_repos = [_simplify_repo(repo) for repo in repos]
             
-            params = {
-                "per_page": per_page,
+            return {
+                "repositories": simplified_repos,
+                "count": len(simplified_repos),
                 "page": page,
-                "sort": sort
+                "per_page": per_page
             }
+        return _error_response(response)
             
-            logger.info(f"Making request to GitHub API with params: {params}")
-            response = await client.get(
-                "https://api.github.com/user/repos",
-                headers=headers,
-                params=params,
-                timeout=10.0
-            )
-            
-            logger.info(f"GitHub API response status: {response.status_code}")
-            
-            if response.status_code == 200:
-                repos = response.json()
-                logger.info(f"Successfully retrieved {len(repos)} repositories")
-                
-                # Extract key information from each repo
-                simplified_repos = []
-                for repo in repos:
-                    simplified_repos.append({
-                        "name": repo.get("name"),
-                        "full_name": repo.get("full_name"),
-                        "description": repo.get("description"),
-                        "private": repo.get("private"),
-                        "html_url": repo.get("html_url"),
-                        "language": repo.get("language"),
-                        "stargazers_count": repo.get("stargazers_count"),
-                        "updated_at": repo.get("updated_at")
-                    })
-                
-                return {
-                    "repositories": simplified_repos,
-                    "count": len(simplified_repos),
-                    "page": page,
-                    "per_page": per_page
-                }
-            elif response.status_code == 401:
-                logger.error("GitHub API returned 401 Unauthorized")
-                return {
-                    "error": "unauthorized",
-                    "message": "Invalid or expired OAuth token",
-                    "status_code": 401
-                }
-            else:
-                logger.error(f"GitHub API returned unexpected status: {response.status_code}")
-                return {
-                    "error": "api_error",
-                    "message": f"GitHub API returned status {response.status_code}",
-                    "status_code": response.status_code,
-                    "response": response.text
-                }
-                
     except httpx.TimeoutException:
         logger.error("Request to GitHub API timed out")
+        return dict(_TIMEOUT)
+    except Exception as e:
+        logger.error("Unexpected error calling GitHub API: %s", e)
         return {
-            "error": "timeout",
-            "message": "Request to GitHub API timed out"
+            "error": "request_failed",
+            "message": f"Failed to call GitHub API: {str(e)}"
         }
+    finally:
+        _current_token.reset(token_reset)
+
+
+async def get_github_repos(
+    repos: List[str],
+    ctx: Context = None
+) -> Dict[str, Any]:
+    """Get details for several GitHub repositories in one call.
+    
+    The repositories are fetched concurrently over the shared client rather
+    than one tool call per repository. Duplicate names are fetched once, and
+    names that aren't valid "owner/repo" names get an error without a request.
+    
+    Args:
+        repos: Up to MAX_REPOS_PER_CALL repository names in "owner/repo" form
+        ctx: MCP Context containing OAuth token
+        
+    Returns:
+        Dict mapping each distinct requested name, in input order, to its
+        repository details or error. If GitHub rejects the token, the
+        top-level unauthorized error is returned instead.
+    """
+    logger.info("Attempting to get %d repositories", len(repos))
+    
+    if len(repos) > MAX_REPOS_PER_CALL:
+        return {
+            "error": "too_many_repos",
+            "message": f"At most {MAX_REPOS_PER_CALL} repositories can be requested per call, got {len(repos)}"
+        }
+    
+    token, error = _extract_token(ctx)
+    if error:
+        return error
+    
+    results = {}
+    to_fetch = []
+    for full_name in dict.fromkeys(repos):
+        if isinstance(full_name, str) and _REPO_NAME_PATTERN.fullmatch(full_name):
+            # Placeholder keeps the result in input order
+            results[full_name] = None
+            to_fetch.append(full_name)
+        else:
+            results[full_name] = {
+                "error": "invalid_repo_name",
+                "message": f"Repository name {full_name!r} is not in owner/repo form"
+            }
+    
+    # Bound the fan-out so a large request doesn't trip GitHub's abuse limits
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    
+    async def fetch_repo(client: httpx.AsyncClient, full_name: str) -> Dict[str, Any]:
+        async with semaphore:
+            response = await _send_with_retry(client.get, f"/repos/{full_name}", auth=_AUTH)
+        
+        if response.status_code == 200:
+            return _simplify_repo(_json_loads(response.content))
+        if response.status_code == 404:
+            return {
+                "error": "not_found",
+                "message": f"Repository {full_name} not found",
+                "status_code": 404
+            }
+        return _error_response(response)
+    
+    # gather runs each fetch in a task that copies the current context
+    token_reset = _current_token.set(token)
+    try:
+        client = _get_client()
+        responses = await asyncio.gather(
+            *(fetch_repo(client, name) for name in to_fetch),
+            return_exceptions=True
+        )
     except Exception as e:
-        logger.error(f"Unexpected error calling GitHub API: {e}")
+        logger.error("Unexpected error calling GitHub API: %s", e)
         return {
             "error": "request_failed",
             "message": f"Failed to call GitHub API: {str(e)}"
         }
+    finally:
+        _current_token.reset(token_reset)
+    
+    for full_name, result in zip(to_fetch, responses):
+        if isinstance(result, BaseException) and not isinstance(result, Exception):
+            # A cancelled fetch (or KeyboardInterrupt/SystemExit) ends the whole call
+            raise result
+        if isinstance(result, dict) and result.get("status_code") == 401:
+            # The token is bad for every repository, so report it once
+            return dict(_UNAUTHORIZED)
+        if isinstance(result, httpx.TimeoutException):
+            results[full_name] = dict(_TIMEOUT)
+        elif isinstance(result, Exception):
+            logger.error("Unexpected error fetching %s: %s", full_name, result)
+            results[full_name] = {
+                "error": "request_failed",
+                "message": f"Failed to call GitHub API: {str(result)}"
+            }
+        else:
+            results[full_name] = result
+    
+    logger.info("Retrieved %d repositories", len(results))
+    return {
+        "results": results,
+        "count": len(results)
+    }
 
 
 async def create_github_issue(
@@ -259,32 +578,13 @@ async def create_github_issue(
     Returns:
         Dict containing created issue information or error
     """
-    logger.info(f"Attempting to create issue in {owner}/{repo}: {title}")
-    
-    if not ctx or not hasattr(ctx, 'request_context') or not hasattr(ctx.request_context, 'meta'):
-        logger.error("Context not available or improperly structured")
-        return {
-            "error": "no_context",
-            "message": "Context not available for OAuth token extraction"
-        }
-    
-    # Get token from meta
-    meta = ctx.request_context.meta
-    token = None
-    
-    if hasattr(meta, 'get'):
-        token = meta.get('current_oauth_token')
-    elif hasattr(meta, 'current_oauth_token'):
-        token = getattr(meta, 'current_oauth_token', None)
+    logger.info("Attempting to create issue in %s/%s: %s", owner, repo, title)
     
-    if not token:
-        logger.error("OAuth token not found in context meta")
-        return {
-            "error": "no_token",
-            "message": "OAuth token not found in context"
-        }
+    token, error = _extract_token(ctx)
+    if error:
+        return error
     
-    logger.info(f"Using OAuth token to create issue")
+    logger.info("Using OAuth token to create issue")
     
     # Build request payload
     payload = {"title": title}
@@ -295,79 +595,55 @@ async def create_github_issue(
     if assignees:
         payload["assignees"] = assignees
     
+    token_reset = _current_token.set(token)
     try:
-        async with httpx.AsyncClient() as client:
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Accept": "application/vnd.github+json",
-                "X-GitHub-Api-Version": "2022-11-28"
+        client = _get_client()
+        
+        logger.info("Making POST request to create issue with payload: %s", payload)
+        response = await _send_with_retry(
+            client.post,
+            f"/repos/{owner}/{repo}/issues",
+            idempotent=False,
+            auth=_AUTH,
+            headers=_JSON_CONTENT_TYPE,
+            content=_json_dumps(payload)
+        )
+        
+        logger.info("GitHub API response status: %s", response.status_code)
+        
+        if response.status_code == 201:
+            issue = _json_loads(response.content)
+            logger.info("Successfully created issue #%s", issue.get('number'))
+            return {
+                "number": issue.get("number"),
+                "title": issue.get("title"),
+                "html_url": issue.get("html_url"),
+                "state": issue.get("state"),
+                "created_at": issue.get("created_at"),
+                "body": issue.get("body"),
+                "labels": [l.get("name") for l in issue.get("labels", [])],
+                "assignees": [a.get("login") for a in issue.get("assignees", [])]
             }
+        if response.status_code == 404:
+            logger.error("GitHub API returned 404 Not Found")
+            return {
+                "error": "not_found",
+                "message": f"Repository {owner}/{repo} not found",
+                "status_code": 404
+            }
+        return _error_response(response, _ISSUE_ERROR_BY_STATUS)
             
-            logger.info(f"Making POST request to create issue with payload: {payload}")
-            response = await client.post(
-                f"https://api.github.com/repos/{owner}/{repo}/issues",
-                headers=headers,
-                json=payload,
-                timeout=10.0
-            )
-            
-            logger.info(f"GitHub API response status: {response.status_code}")
-            
-            if response.status_code == 201:
-                issue = response.json()
-                logger.info(f"Successfully created issue #{issue.get('number')}")
-                return {
-                    "number": issue.get("number"),
-                    "title": issue.get("title"),
-                    "html_url": issue.get("html_url"),
-                    "state": issue.get("state"),
-                    "created_at": issue.get("created_at"),
-                    "body": issue.get("body"),
-                    "labels": [l.get("name") for l in issue.get("labels", [])],
-                    "assignees": [a.get("login") for a in issue.get("assignees", [])]
-                }
-            elif response.status_code == 401:
-                logger.error("GitHub API returned 401 Unauthorized")
-                return {
-                    "error": "unauthorized",
-                    "message": "Invalid or expired OAuth token",
-                    "status_code": 401
-                }
-            elif response.status_code == 403:
-                logger.error("GitHub API returned 403 Forbidden")
-                return {
-                    "error": "forbidden",
-                    "message": "Token lacks permission to create issues in this repository",
-                    "status_code": 403
-                }
-            elif response.status_code == 404:
-                logger.error("GitHub API returned 404 Not Found")
-                return {
-                    "error": "not_found",
-                    "message": f"Repository {owner}/{repo} not found",
-                    "status_code": 404
-                }
-            else:
-                logger.error(f"GitHub API returned unexpected status: {response.status_code}")
-                return {
-                    "error": "api_error",
-                    "message": f"GitHub API returned status {response.status_code}",
-                    "status_code": response.status_code,
-                    "response": response.text
-                }
-                
     except httpx.TimeoutException:
         logger.error("Request to GitHub API timed out")
-        return {
-            "error": "timeout",
-            "message": "Request to GitHub API timed out"
-        }
+        return dict(_TIMEOUT)
     except Exception as e:
-        logger.error(f"Unexpected error calling GitHub API: {e}")
+        logger.error("Unexpected error calling GitHub API: %s", e)
         return {
             "error": "request_failed",
             "message": f"Failed to call GitHub API: {str(e)}"
         }
+    finally:
+        _current_token.reset(token_reset)
 
 
 # Export tools with their OAuth configuration
@@ -378,6 +654,7 @@ oauth_passthrough_tools = [
     # Each tuple is (provider, tool_function)
     ("github", get_github_user),
     ("github", list_user_repos),
+    ("github", get_github_repos),
     ("github", create_github_issue),
 ]
 